@@ -0,0 +1,62 @@
+"""
+Measures how many messages per second each of the available
+codecs (including binary codecs, like MessagePack) can encode
+and decode.
+
+The message used is the "update" notification sent after a move
+in a Connect-M match (with a board of the size specified with
+--rows and --cols).
+
+Usage:
+
+    python3 benchmarks/codec.py [--rows ROWS] [--cols COLS] [--iterations N]
+"""
+import argparse
+import timeit
+
+from chimera.common.codec import CODECS, DEFAULT_CODEC, SUBPROTOCOL_CODECS
+from chimera.examples.connectm import ConnectMBoard, PieceColor
+
+
+def update_notification(nrows, ncols):
+    board = ConnectMBoard(nrows, ncols, 4)
+    for col in range(0, ncols, 2):
+        board.drop(col, PieceColor.RED)
+        board.drop(col + 1 if col + 1 < ncols else 0, PieceColor.YELLOW)
+
+    return {"type": "notification",
+            "scope": "match",
+            "event": "update",
+            "data": {"match-id": "magnificent-platypus",
+                     "match-status": "in-progress",
+                     "game-id": "connectm",
+                     "game-state": {"turn": "Alex",
+                                    "players": {"Alex": "R", "Sam": "Y"},
+                                    "board": board.to_str_grid()}}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chimera codec benchmark")
+    parser.add_argument("--rows", type=int, default=6)
+    parser.add_argument("--cols", type=int, default=7)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    msg = update_notification(args.rows, args.cols)
+
+    print(f"Board: {args.rows}x{args.cols}, {args.iterations} iterations "
+          f"(default codec: {DEFAULT_CODEC.name})")
+    print(f"{'codec':<10} {'size':>8} {'encode/s':>12} {'decode/s':>12}")
+    codecs = list(CODECS.values()) + list(SUBPROTOCOL_CODECS.values())
+    for codec in codecs:
+        name = codec.name
+        raw_message = codec.encode(msg)
+        encode_time = timeit.timeit(lambda: codec.encode(msg), number=args.iterations)
+        decode_time = timeit.timeit(lambda: codec.decode(raw_message), number=args.iterations)
+
+        print(f"{name:<10} {len(raw_message):>8} "
+              f"{args.iterations / encode_time:>12,.0f} {args.iterations / decode_time:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
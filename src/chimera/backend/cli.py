@@ -8,6 +8,7 @@ from importlib import import_module
 from click_loglevel import LogLevel
 
 from chimera.backend.websocket import WebSocketsChimeraServer
+from chimera.common.codec import CODECS, DEFAULT_CODEC
 
 
 async def chimera_server(ws_server):
@@ -38,14 +39,18 @@ def load_game_cls(full_cls_name):
 @click.option('--addrport', type=click.STRING, default="127.0.0.1:14200")
 @click.option('--load-game', type=click.STRING)
 @click.option("--log-level", type=LogLevel(), default=logging.INFO)
-def cmd(addrport, load_game, log_level):
+@click.option('--max-concurrent-requests', type=click.IntRange(min=1), default=16,
+              help="Maximum number of requests from a single client that can be processed concurrently")
+@click.option('--codec', type=click.Choice(list(CODECS)), default=DEFAULT_CODEC.name,
+              help="JSON library used to encode and decode messages")
+def cmd(addrport, load_game, log_level, max_concurrent_requests, codec):
     # TODO: Validate address and port
     host, port = addrport.split(":")
 
     if host == "*":
         host = None
 
-    ws_server = WebSocketsChimeraServer(host, port)
+    ws_server = WebSocketsChimeraServer(host, port, max_concurrent_requests, CODECS[codec])
 
     logging.basicConfig(format='%(asctime)s %(name)s %(levelname)s %(message)s')
     chimera_logger = logging.getLogger("chimera")
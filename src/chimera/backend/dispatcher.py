@@ -0,0 +1,78 @@
+import asyncio
+import logging
+
+LOGGER = logging.getLogger("chimera.server")
+
+
+class RequestDispatcher:
+    """
+    Runs the requests received on a single connection as concurrent
+    tasks, while preserving the order of requests that share the
+    same ordering key (e.g., all the requests for the same match).
+    Requests with a key of RequestDispatcher.UNORDERED can run
+    alongside any other request.
+
+    At most max_concurrent requests will be in flight at any
+    given time. Once that limit is reached, submit() will wait
+    until one of the in-flight requests is done (so the connection
+    stops reading new requests until then).
+    """
+
+    UNORDERED = object()
+
+    def __init__(self, max_concurrent):
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1 (got {max_concurrent})")
+
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._tasks = set()
+
+        # Last task submitted with each ordering key
+        self._tails = {}
+
+    async def submit(self, key, coro_func, *args):
+        """ Schedules coro_func(*args) to run as a task
+
+        The task will not start until all the previously submitted
+        tasks with the same key are done.
+        """
+        await self._semaphore.acquire()
+
+        prev_task = None
+        if key is not RequestDispatcher.UNORDERED:
+            prev_task = self._tails.get(key)
+
+        task = asyncio.create_task(self._run(prev_task, coro_func, *args))
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+        if key is not RequestDispatcher.UNORDERED:
+            self._tails[key] = task
+            task.add_done_callback(lambda t: self._remove_tail(key, t))
+
+    async def wait_all(self):
+        """ Waits until all the submitted tasks are done """
+        if len(self._tasks) > 0:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    @property
+    def num_pending(self):
+        return len(self._tasks)
+
+    async def _run(self, prev_task, coro_func, *args):
+        try:
+            if prev_task is not None:
+                # We only care that the previous task is done,
+                # not whether it was successful
+                await asyncio.wait([prev_task])
+            await coro_func(*args)
+        except Exception:
+            LOGGER.exception("Unexpected exception while processing request")
+
+    def _task_done(self, task):
+        self._tasks.discard(task)
+        self._semaphore.release()
+
+    def _remove_tail(self, key, task):
+        if self._tails.get(key) is task:
+            del self._tails[key]
@@ -1,22 +1,22 @@
-import json
 import logging
 
 from chimera.backend.server import BaseChimeraServer, BaseConnectedClient
+from chimera.common.codec import DEFAULT_CODEC
 
 LOGGER = logging.getLogger("chimera.messaging")
 
 
 class FakeConnectedClient(BaseConnectedClient):
 
-    def __init__(self, name, notification_callback=None):
-        super().__init__()
+    def __init__(self, name, notification_callback=None, codec=DEFAULT_CODEC):
+        super().__init__(codec)
         self.name = name
         self._responses = []
         self._notifications = []
 
-    async def _send_msg(self, msg):
-        msg_str = json.dumps(msg)
-        LOGGER.debug(f"Server -> {self.name} | {msg_str}")
+    async def _send_raw(self, raw_message):
+        LOGGER.debug(f"Server -> {self.name} | {raw_message}")
+        msg = self.codec.decode(raw_message)
         if msg["type"] == "response":
             self._responses.append(msg)
         elif msg["type"] == "notification":
@@ -45,8 +45,8 @@ class FakeConnectedClient(BaseConnectedClient):
 
 class FakeChimeraServer(BaseChimeraServer):
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, codec=DEFAULT_CODEC):
+        super().__init__(codec)
         self.clients = []
 
     async def start(self):
@@ -56,7 +56,7 @@ class FakeChimeraServer(BaseChimeraServer):
         pass
 
     def create_client(self, name="Client"):
-        client = FakeConnectedClient(name)
+        client = FakeConnectedClient(name, codec=self.codec)
         self.clients.append(client)
         return client
 
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import copy
 from abc import ABC, abstractmethod
 from typing import Callable, Dict
 
 from coolname import generate_slug  # type: ignore
 
 from chimera.common import ErrorCode
+from chimera.common.codec import DEFAULT_CODEC, DecodeError
+from chimera.common.jsonpatch import make_patch
 from chimera.authoring import Game
 import chimera.exceptions as exc
 
@@ -32,6 +35,11 @@ class Match:
         self.state = Match.STATE_WAITING_FOR_PLAYERS
         self.subscribers = set()
 
+        # Subscribers that requested delta updates, mapped to the
+        # last game state that was sent to them (None if they
+        # have not been sent a game state yet)
+        self.delta_bases = {}
+
     def add_player(self, player_name):
         player = self.game._create_player(player_name)
         self.game._add_player(player)
@@ -41,8 +49,10 @@ class Match:
 
         return player
 
-    def add_subscriber(self, client):
+    def add_subscriber(self, client, delta_updates=False):
         self.subscribers.add(client)
+        if delta_updates:
+            self.delta_bases[client] = None
 
     def is_ready(self):
         return self.state == Match.STATE_READY
@@ -65,18 +75,56 @@ class Match:
     async def start(self):
         self.state = Match.STATE_INPROGRESS
         self.game.on_start()
-        for client in self.subscribers:
-            await client.send_notification("match", "start", self.match_state)
+        match_state = self.match_state
+        self._update_delta_bases(self.delta_bases, match_state)
+        await BaseConnectedClient.broadcast_notification(self.subscribers, "match", "start", match_state)
 
     async def notify_update(self):
+        match_state = self.match_state
+
+        # Subscribers in delta mode get a patch against the last
+        # game state they were sent. Since most of them will share
+        # the same base state, we group them by base state, and
+        # only compute (and encode) each patch once.
+        full_clients = []
+        delta_clients = {}
         for client in self.subscribers:
-            await client.send_notification("match", "update", self.match_state)
+            base = self.delta_bases.get(client)
+            if base is None:
+                full_clients.append(client)
+            else:
+                delta_clients.setdefault(id(base), (base, []))[1].append(client)
+
+        broadcasts = [BaseConnectedClient.broadcast_notification(full_clients, "match", "update", match_state)]
+        for base, clients in delta_clients.values():
+            data = {k: v for k, v in match_state.items() if k != "game-state"}
+            data["game-state-patch"] = make_patch(base, match_state["game-state"])
+            broadcasts.append(BaseConnectedClient.broadcast_notification(clients, "match", "update", data))
+        await asyncio.gather(*broadcasts)
+
+        self._update_delta_bases(self.delta_bases, match_state)
+
+    async def resync(self, client):
+        match_state = self.match_state
+        if client in self.delta_bases:
+            self._update_delta_bases([client], match_state)
+        await client.send_notification("match", "update", match_state)
 
     async def end(self):
         self.state = Match.STATE_DONE
         self.game.on_end()
-        for client in self.subscribers:
-            await client.send_notification("match", "end", self.match_state)
+        match_state = self.match_state
+        await BaseConnectedClient.broadcast_notification(self.subscribers, "match", "end", match_state)
+
+    def _update_delta_bases(self, clients, match_state):
+        if len(self.delta_bases) == 0:
+            return
+
+        # Keep our own copy, in case the game hands us
+        # objects that it will later modify in place
+        base = copy.deepcopy(match_state["game-state"])
+        for client in clients:
+            self.delta_bases[client] = base
 
 
 class RegisteredGame:
@@ -92,14 +140,39 @@ class RegisteredGame:
 
 class BaseConnectedClient(ABC):
 
-    def __init__(self):
+    def __init__(self, codec=DEFAULT_CODEC):
         self.current_match = None
         self.current_player = None
+        self.codec = codec
 
     @abstractmethod
-    async def _send_msg(self, msg):
+    async def _send_raw(self, raw_message):
         pass
 
+    def _encode_msg(self, msg):
+        return self.codec.encode(msg)
+
+    async def _send_msg(self, msg):
+        await self._send_raw(self._encode_msg(msg))
+
+    @classmethod
+    async def _broadcast_raw(cls, clients, raw_message):
+        # Send to all the clients concurrently, so a slow
+        # client will not hold up the rest. Subclasses may
+        # override this if their transport has a more efficient
+        # way of sending the same message to many clients.
+        await asyncio.gather(*(client._send_raw(raw_message) for client in clients))
+
+    @staticmethod
+    def _create_notification(scope, event, data):
+        msg = {}
+        msg["type"] = "notification"
+        msg["scope"] = scope
+        msg["event"] = event
+        msg["data"] = data
+
+        return msg
+
     async def send_error(self, msg_id, error_code, data=None):
         msg = {}
         msg["type"] = "response"
@@ -121,18 +194,38 @@ class BaseConnectedClient(ABC):
         await self._send_msg(msg)
 
     async def send_notification(self, scope, event, data):
-        msg = {}
-        msg["type"] = "notification"
-        msg["scope"] = scope
-        msg["event"] = event
-        msg["data"] = data
+        msg = self._create_notification(scope, event, data)
 
         await self._send_msg(msg)
 
+    @staticmethod
+    async def broadcast_notification(clients, scope, event, data):
+        # Sends the same notification to several clients. The
+        # notification is encoded only once per codec, regardless
+        # of the number of clients.
+        if len(clients) == 0:
+            return
+
+        msg = BaseConnectedClient._create_notification(scope, event, data)
 
-def register_handler(handler_name):
+        clients_by_codec = {}
+        for client in clients:
+            clients_by_codec.setdefault((client.codec, type(client)), []).append(client)
+
+        raw_messages = {}
+        broadcasts = []
+        for (codec, client_cls), codec_clients in clients_by_codec.items():
+            if codec not in raw_messages:
+                raw_messages[codec] = codec_clients[0]._encode_msg(msg)
+            broadcasts.append(client_cls._broadcast_raw(codec_clients, raw_messages[codec]))
+
+        await asyncio.gather(*broadcasts)
+
+
+def register_handler(handler_name, read_only=False):
     def wrapper(func):
         func.handler_name = handler_name
+        func.read_only = read_only
         return func
 
     return wrapper
@@ -144,10 +237,11 @@ MessageHandlerType = Callable[["BaseChimeraServer", BaseConnectedClient, dict],
 class BaseChimeraServer(ABC):
     MSG_HANDLERS: Dict[str, MessageHandlerType] = {}
 
-    def __init__(self):
+    def __init__(self, codec=DEFAULT_CODEC):
         self.clients = {}
         self.games = {}
         self.matches = {}
+        self.codec = codec
 
     @abstractmethod
     async def start(self):
@@ -158,16 +252,60 @@ class BaseChimeraServer(ABC):
         pass
 
     async def _process_message(self, client, raw_message):
+        requests = await self._parse_requests(client, raw_message)
+
+        for msg, handler_func in requests:
+            await handler_func(self, client, msg)
+
+    async def _parse_requests(self, client, raw_message):
+        # Parses a message, which can contain a single request or
+        # an array of requests (a batch). Returns a list of
+        # (request, handler) tuples, with one tuple per correct
+        # request (errors are sent to the client for any
+        # incorrect requests).
+
         # Check that the JSON is correct
         try:
-            msg = json.loads(raw_message)
-        except json.JSONDecodeError as json_exc:
-            error_details = f"Incorrect JSON (parsing failed at line {json_exc.lineno} column {json_exc.colno})"
+            msg = client.codec.decode(raw_message)
+        except DecodeError as decode_exc:
+            error_details = f"Incorrect {client.codec.encoding} ({decode_exc.details})"
             await client.send_error(msg_id=None,
                                     error_code=ErrorCode.PARSE_ERROR,
                                     data={"details": error_details}
                                     )
-            return
+            return []
+
+        if not isinstance(msg, list):
+            request = await self._validate_request(client, msg)
+            return [request] if request is not None else []
+
+        if len(msg) == 0:
+            await client.send_error(msg_id=None,
+                                    error_code=ErrorCode.INCORRECT_REQUEST,
+                                    data={"details": "Empty batch"}
+                                    )
+            return []
+
+        requests = []
+        for batch_msg in msg:
+            request = await self._validate_request(client, batch_msg)
+            if request is not None:
+                requests.append(request)
+
+        return requests
+
+    async def _validate_request(self, client, msg):
+        # Validates a single request message, and finds the
+        # handler for the requested operation. If the request is
+        # not correct, sends an error to the client and returns None.
+
+        # Check that we've received an object
+        if not isinstance(msg, dict):
+            await client.send_error(msg_id=None,
+                                    error_code=ErrorCode.INCORRECT_REQUEST,
+                                    data={"details": "Message is not an object"}
+                                    )
+            return None
 
         # Check that a type member has been included
         message_type = msg.get("type")
@@ -176,7 +314,7 @@ class BaseChimeraServer(ABC):
                                     error_code=ErrorCode.INCORRECT_REQUEST,
                                     data={"details": "Message has no 'type' member"}
                                     )
-            return
+            return None
 
         # Check that we've received a request message
         if message_type != "request":
@@ -184,7 +322,7 @@ class BaseChimeraServer(ABC):
                                     error_code=ErrorCode.INCORRECT_REQUEST,
                                     data={"details": f"Incorrect message type: {msg['type']}"}
                                     )
-            return
+            return None
 
         # Check that the request includes an id
         msg_id = msg.get("id")
@@ -193,7 +331,7 @@ class BaseChimeraServer(ABC):
                                     error_code=ErrorCode.INCORRECT_REQUEST,
                                     data={"details": f"No id specified"}
                                     )
-            return
+            return None
 
         # Check that the operation is correct (i.e., an operation
         # has been specified, and we have a handler for that operation)
@@ -203,16 +341,16 @@ class BaseChimeraServer(ABC):
                                     error_code=ErrorCode.INCORRECT_REQUEST,
                                     data={"details": f"No operation specified"}
                                     )
-            return
+            return None
 
         handler_func = BaseChimeraServer.MSG_HANDLERS.get(operation)
         if handler_func is None:
             await client.send_error(msg_id=msg_id,
                                     error_code=ErrorCode.NO_SUCH_OPERATION
                                     )
-            return
+            return None
 
-        await handler_func(self, client, msg)
+        return msg, handler_func
 
     def register_game(self, game_id, game_cls, description):
         if not issubclass(game_cls, Game):
@@ -233,7 +371,18 @@ class BaseChimeraServer(ABC):
 
         return True
 
-    @register_handler("list-games")
+    async def _validate_delta_updates(self, client, msg):
+        delta_updates = msg["params"].get("delta-updates", False)
+        if not isinstance(delta_updates, bool):
+            await client.send_error(msg_id=msg["id"],
+                                    error_code=ErrorCode.INCORRECT_PARAMS,
+                                    data={"details": "The 'delta-updates' parameter must be a boolean"}
+                                    )
+            return None
+
+        return delta_updates
+
+    @register_handler("list-games", read_only=True)
     async def _handle_list_games(self, client, msg):
         games = []
         for rg in self.games.values():
@@ -255,6 +404,10 @@ class BaseChimeraServer(ABC):
         if not await self._validate_params(client, msg, ["game", "player-name"]):
             return
 
+        delta_updates = await self._validate_delta_updates(client, msg)
+        if delta_updates is None:
+            return
+
         game_id = params["game"]
         rg = self.games.get(game_id)
         if rg is None:
@@ -276,7 +429,7 @@ class BaseChimeraServer(ABC):
         player = match.add_player(params["player-name"])
         client.current_match = match
         client.current_player = player
-        match.add_subscriber(client)
+        match.add_subscriber(client, delta_updates)
 
         self.matches[match_id] = match
 
@@ -297,6 +450,10 @@ class BaseChimeraServer(ABC):
         if not await self._validate_params(client, msg, ["game", "player-name", "match-id"]):
             return
 
+        delta_updates = await self._validate_delta_updates(client, msg)
+        if delta_updates is None:
+            return
+
         match_id = params["match-id"]
         match = self.matches.get(match_id)
         if match is None:
@@ -325,7 +482,7 @@ class BaseChimeraServer(ABC):
         player = match.add_player(player_name)
         client.current_match = match
         client.current_player = player
-        match.add_subscriber(client)
+        match.add_subscriber(client, delta_updates)
 
         response_result = {}
 
@@ -336,6 +493,27 @@ class BaseChimeraServer(ABC):
         if match.is_ready():
             await match.start()
 
+    @register_handler("resync-match")
+    async def _handle_resync_match(self, client, msg):
+        params = msg["params"]
+        if not await self._validate_params(client, msg, ["match-id"]):
+            return
+
+        match_id = params["match-id"]
+        match = self.matches.get(match_id)
+        if match is None or client not in match.subscribers:
+            await client.send_error(msg_id=msg["id"],
+                                    error_code=ErrorCode.INCORRECT_MATCH,
+                                    data={"details": f"You are not in {match_id} (or that match does not exist)"}
+                                    )
+            return
+
+        await client.send_response(msg["id"], {})
+
+        # There is no game state to send until the match starts
+        # (at which point all subscribers get a full snapshot anyway)
+        if match.state == Match.STATE_INPROGRESS:
+            await match.resync(client)
 
     @register_handler("game-action")
     async def _handle_game_action(self, client, msg):
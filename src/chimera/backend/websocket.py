@@ -3,38 +3,52 @@ import signal
 
 import websockets
 import logging
-import json
 
+from chimera.backend.dispatcher import RequestDispatcher
 from chimera.backend.server import BaseConnectedClient, BaseChimeraServer
+from chimera.common.codec import DEFAULT_CODEC, SUBPROTOCOL_CODECS
 
 LOGGER = logging.getLogger("chimera.server")
 
 class WebSocketsConnectedClient(BaseConnectedClient):
 
-    def __init__(self, websocket):
-        super().__init__()
+    def __init__(self, websocket, codec):
+        super().__init__(codec)
         self.websocket = websocket
         host, port = websocket.remote_address
         self.client_str = f"{host}:{port}"
 
-    async def _send_msg(self, msg):
-        raw_message = json.dumps(msg)
+    async def _send_raw(self, raw_message):
         LOGGER.debug(f"{self.client_str} SEND: {raw_message}")
         await self.websocket.send(raw_message)
 
+    @classmethod
+    async def _broadcast_raw(cls, clients, raw_message):
+        # websockets.broadcast writes the message to every connection
+        # without waiting for any of them to drain their buffers
+        # (and skips connections that are closed or closing)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            for client in clients:
+                LOGGER.debug(f"{client.client_str} SEND: {raw_message}")
+        websockets.broadcast([client.websocket for client in clients], raw_message)
+
 
 class WebSocketsChimeraServer(BaseChimeraServer):
 
-    def __init__(self, address, port):
-        super().__init__()
+    def __init__(self, address, port, max_concurrent_requests=16, codec=DEFAULT_CODEC):
+        super().__init__(codec)
         self.address = address
         self.port = port
+        self.max_concurrent_requests = max_concurrent_requests
         self._server_task = None
         self._ready = None
         self._stop = None
 
     async def _serve(self):
-        async with websockets.serve(self._handler, self.address, self.port):
+        # Clients can request a binary encoding through the
+        # subprotocol (otherwise, we will use our JSON codec)
+        subprotocols = list(SUBPROTOCOL_CODECS) + [self.codec.subprotocol]
+        async with websockets.serve(self._handler, self.address, self.port, subprotocols=subprotocols):
             self._ready.set_result(True)
             LOGGER.info(f"Server listening on {self.address}:{self.port}")
             await self._stop
@@ -57,17 +71,47 @@ class WebSocketsChimeraServer(BaseChimeraServer):
         await self._server_task
 
     async def _handler(self, websocket):
-        client = WebSocketsConnectedClient(websocket)
+        codec = SUBPROTOCOL_CODECS.get(websocket.subprotocol, self.codec)
+        client = WebSocketsConnectedClient(websocket, codec)
         self.clients[websocket] = client
         host, port = websocket.remote_address
         client_str = f"{host}:{port}"
-        LOGGER.info(f"{client_str} Connected")
+        LOGGER.info(f"{client_str} Connected (encoding: {codec.encoding})")
+
+        # Requests are processed concurrently, except for requests
+        # on the same match (which are processed in the order they
+        # were received). Read-only requests can run alongside
+        # any other request.
+        dispatcher = RequestDispatcher(self.max_concurrent_requests)
         try:
             async for raw_message in websocket:
                 LOGGER.debug(f"{client_str} RCVD: {raw_message}")
-                await self._process_message(client, raw_message)
+                requests = await self._parse_requests(client, raw_message)
+                for msg, handler_func in requests:
+                    key = self._ordering_key(handler_func, msg)
+                    await dispatcher.submit(key, self._handle_request, handler_func, client, msg)
         except websockets.exceptions.ConnectionClosed:
             pass
+        await dispatcher.wait_all()
         LOGGER.info(f"{client_str} Disconnected")
 
         del self.clients[websocket]
+
+    @staticmethod
+    def _ordering_key(handler_func, msg):
+        if handler_func.read_only:
+            return RequestDispatcher.UNORDERED
+
+        # Requests that don't specify a (valid) match are
+        # all processed in order with respect to each other
+        params = msg.get("params")
+        if isinstance(params, dict) and isinstance(params.get("match-id"), str):
+            return params["match-id"]
+        else:
+            return None
+
+    async def _handle_request(self, handler_func, client, msg):
+        try:
+            await handler_func(self, client, msg)
+        except websockets.exceptions.ConnectionClosed:
+            pass
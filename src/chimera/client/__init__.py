@@ -1,8 +1,9 @@
 from typing import Callable, Optional
 
 from chimera.backend.fake import FakeChimeraServer
-from chimera.client.api import ClientAPI, MatchNotification, MatchNotificationCallback
-from chimera.client.connectors import WebSocketsConnector, FakeConnector
+from chimera.client.api import ClientAPI, AsyncClientAPI, MatchNotification, MatchNotificationCallback
+from chimera.client.connectors import WebSocketsConnector, AsyncWebSocketsConnector, FakeConnector
+from chimera.common.codec import Codec, DEFAULT_CODEC
 from chimera.exceptions import ChimeraConnectionRefusedException
 import chimera.authoring
 
@@ -22,7 +23,8 @@ class Chimera(ClientAPI):
     """
 
     def __init__(self, host: str, port: str = "14200",
-                 notification_callback: Optional[MatchNotificationCallback] = None):
+                 notification_callback: Optional[MatchNotificationCallback] = None,
+                 codec: Codec = DEFAULT_CODEC):
         """ Constructor
 
         Raises:
@@ -33,8 +35,10 @@ class Chimera(ClientAPI):
             port: Port to connect to (default: "14200")
             notification_callback: Optional callback function to call
                 any time a match notification is received
+            codec: Codec used to encode and decode messages
+                (default: the fastest codec available)
         """
-        connector = WebSocketsConnector(self, host, port)
+        connector = WebSocketsConnector(self, host, port, codec)
         super().__init__(connector, notification_callback)
         try:
             self._connector.connect()
@@ -51,6 +55,70 @@ class Chimera(ClientAPI):
         self._connector.disconnect()
 
 
+class AsyncChimera(AsyncClientAPI):
+    """
+    Chimera client for use with asyncio. Works like the Chimera
+    class, except that all the methods that send requests to the
+    server are coroutines, and the connection has to be explicitly
+    opened (and closed), either by calling connect() and
+    disconnect() or by using the object as an async context manager.
+
+    Examples:
+
+        >>> async with AsyncChimera("chimera.example.org") as chimera:
+        ...     games = await chimera.get_games()
+        ...     connectm = games["connectm"]
+        ...     match = await connectm.create_match("Alex")
+        ...     async for notification in match.notifications():
+        ...         print(notification.event)
+
+    """
+
+    def __init__(self, host: str, port: str = "14200",
+                 notification_callback: Optional[MatchNotificationCallback] = None,
+                 codec: Codec = DEFAULT_CODEC):
+        """ Constructor
+
+        Args:
+            host: Hostname of Chimera server
+            port: Port to connect to (default: "14200")
+            notification_callback: Optional callback function to call
+                any time a match notification is received (if None,
+                notifications are queued in their match)
+            codec: Codec used to encode and decode messages
+                (default: the fastest codec available)
+        """
+        connector = AsyncWebSocketsConnector(self, host, port, codec)
+        super().__init__(connector, notification_callback)
+
+    async def connect(self) -> None:
+        """ Connects to the server
+
+        Raises:
+            ChimeraConnectionRefusedException: if unable to connect to the server
+
+        Returns: None
+        """
+        try:
+            await self._connector.connect()
+        except ConnectionRefusedError as cre:
+            raise ChimeraConnectionRefusedException(cre) from cre
+
+    async def disconnect(self) -> None:
+        """ Disconnects from the server
+
+        Returns: None
+        """
+        await self._connector.disconnect()
+
+    async def __aenter__(self) -> "AsyncChimera":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.disconnect()
+
+
 class FakeChimera(ClientAPI):
     """
     A 'fake' implementation of the client API, used for testing
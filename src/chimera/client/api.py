@@ -1,24 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 from queue import Queue, Empty
-from typing import Callable, Dict, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 
+from chimera.common.jsonpatch import apply_patch
 from chimera.exceptions import MalformedResponse, ErrorResponse, ERROR_EXCEPTIONS
 
 
-class Game:
+class BaseGame:
     """
-    Class representing a game on the Chimera server.
+    Base class for games on the Chimera server (shared by the
+    synchronous and asyncio client APIs)
 
     Should not be instantiated directly.
     """
 
-    _api: ClientAPI
+    _api: BaseClientAPI
     _id: str
     _description: str
-    _matches: Dict[str, Match]
 
-    def __init__(self, api: ClientAPI, game_id: str, description: str):
+    def __init__(self, api: BaseClientAPI, game_id: str, description: str):
         """ Constructor
 
         Args:
@@ -29,10 +31,9 @@ class Game:
         self._api = api
         self._id = game_id
         self._description = description
-        self._matches = {}
 
     def __repr__(self) -> str:
-        return f"Game('{self._id}', '{self._description}')"
+        return f"{type(self).__name__}('{self._id}', '{self._description}')"
 
     @property
     def id(self) -> str:
@@ -44,11 +45,51 @@ class Game:
         """Get game description"""
         return self._description
 
-    def create_match(self, player_name: str) -> Match:
+    def _create_match_params(self, player_name: str, delta_updates: bool) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"game": self.id, "player-name": player_name}
+        if delta_updates:
+            params["delta-updates"] = True
+        return params
+
+    def _join_match_params(self, match_id: str, player_name: str, delta_updates: bool) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"game": self.id, "match-id": match_id, "player-name": player_name}
+        if delta_updates:
+            params["delta-updates"] = True
+        return params
+
+    @staticmethod
+    def _validate_create_match_response(response: dict) -> str:
+        if "match-id" not in response["result"]:
+            raise MalformedResponse("Missing 'match-id' field", response)
+
+        return response["result"]["match-id"]
+
+    @staticmethod
+    def _validate_join_match_response(response: dict) -> None:
+        if len(response["result"]) != 0:
+            raise MalformedResponse("Unexpected results in 'join-match'", response)
+
+    def _add_match(self, match: BaseMatch) -> None:
+        self._api._matches[(self.id, match.id)] = match
+
+
+class Game(BaseGame):
+    """
+    Class representing a game on the Chimera server.
+
+    Should not be instantiated directly.
+    """
+
+    _api: ClientAPI
+
+    def create_match(self, player_name: str, delta_updates: bool = False) -> Match:
         """ Creates a new match
 
         Args:
             player_name: Player name to use in the match
+            delta_updates: If True, the server will send "update"
+                notifications with only the changes to the game
+                state (instead of the full game state)
 
         Raises:
             AlreadyInAMatch: If player is already in another match
@@ -56,25 +97,24 @@ class Game:
         Returns: Match object
 
         """
-        params = {"game": self.id, "player-name": player_name}
+        params = self._create_match_params(player_name, delta_updates)
         response = self._api.send_request("create-match", params)
+        match_id = self._validate_create_match_response(response)
 
-        if "match-id" not in response["result"]:
-            raise MalformedResponse("Missing 'match-id' field", response)
-
-        match_id = response["result"]["match-id"]
         match = Match(self._api, self, match_id, player_name)
-
-        self._api._matches[(self.id, match_id)] = match
+        self._add_match(match)
 
         return match
 
-    def join_match(self, match_id: str, player_name: str) -> Match:
+    def join_match(self, match_id: str, player_name: str, delta_updates: bool = False) -> Match:
         """ Joins an existing match
 
         Args:
             match_id:
             player_name:
+            delta_updates: If True, the server will send "update"
+                notifications with only the changes to the game
+                state (instead of the full game state)
 
         Raises:
             AlreadyInAMatch: If the player is already in a match
@@ -85,21 +125,83 @@ class Game:
         Returns: Match object
 
         """
-        params = {"game": self.id, "match-id": match_id, "player-name": player_name}
+        params = self._join_match_params(match_id, player_name, delta_updates)
         response = self._api.send_request("join-match", params)
-
-        if len(response["result"]) != 0:
-            raise MalformedResponse("Unexpected results in 'join-match'", response)
+        self._validate_join_match_response(response)
 
         match = Match(self._api, self, match_id, player_name)
-        self._api._matches[(self.id, match_id)] = match
+        self._add_match(match)
 
         return match
 
 
-class Match:
+class AsyncGame(BaseGame):
     """
-    Class representing a match in the server.
+    Class representing a game on the Chimera server, when using
+    the asyncio client API (AsyncChimera)
+
+    Should not be instantiated directly.
+    """
+
+    _api: AsyncClientAPI
+
+    async def create_match(self, player_name: str, delta_updates: bool = False) -> AsyncMatch:
+        """ Creates a new match
+
+        Args:
+            player_name: Player name to use in the match
+            delta_updates: If True, the server will send "update"
+                notifications with only the changes to the game
+                state (instead of the full game state)
+
+        Raises:
+            AlreadyInAMatch: If player is already in another match
+
+        Returns: AsyncMatch object
+
+        """
+        params = self._create_match_params(player_name, delta_updates)
+        response = await self._api.send_request("create-match", params)
+        match_id = self._validate_create_match_response(response)
+
+        match = AsyncMatch(self._api, self, match_id, player_name)
+        self._add_match(match)
+
+        return match
+
+    async def join_match(self, match_id: str, player_name: str, delta_updates: bool = False) -> AsyncMatch:
+        """ Joins an existing match
+
+        Args:
+            match_id: Match identifier
+            player_name: Player name to use in the match
+            delta_updates: If True, the server will send "update"
+                notifications with only the changes to the game
+                state (instead of the full game state)
+
+        Raises:
+            AlreadyInAMatch: If the player is already in a match
+            UnknownMatch: If there is no match for the provided match identifier
+            DuplicatePlayer: If there is already a player with the same name
+                in the match
+
+        Returns: AsyncMatch object
+
+        """
+        params = self._join_match_params(match_id, player_name, delta_updates)
+        response = await self._api.send_request("join-match", params)
+        self._validate_join_match_response(response)
+
+        match = AsyncMatch(self._api, self, match_id, player_name)
+        self._add_match(match)
+
+        return match
+
+
+class BaseMatch:
+    """
+    Base class for matches in the server (shared by the
+    synchronous and asyncio client APIs)
 
     Should never be instantiated directly.
     """
@@ -110,16 +212,17 @@ class Match:
     STATUS_DONE = "done"
     STATUS_UNKNOWN = None
 
-    _api: ClientAPI
-    _game: Game
+    _api: BaseClientAPI
+    _game: BaseGame
     _match_id: str
     _status: Optional[str]
     _player_name: str
     _winner: Optional[str]
     _game_state: Optional[dict]
-    _notifications: Queue
+    _last_game_state: Optional[dict]
+    _notifications: Union[Queue, asyncio.Queue]
 
-    def __init__(self, api: ClientAPI, game: Game, match_id: str, player_name: str):
+    def __init__(self, api: BaseClientAPI, game: BaseGame, match_id: str, player_name: str):
         """ Constructor
 
         Args:
@@ -131,15 +234,15 @@ class Match:
         self._api = api
         self._game = game
         self._match_id = match_id
-        self._status = Match.STATUS_UNKNOWN
+        self._status = BaseMatch.STATUS_UNKNOWN
         self._player_name = player_name
         self._winner = None
         self._game_state = None
-        self._notifications = Queue()
+        self._last_game_state = None
 
     def __repr__(self) -> str:
         """Returns string representation of object"""
-        return f"Match(<Game '{self._game.id}'>, '{self._match_id}')"
+        return f"{type(self).__name__}(<Game '{self._game.id}'>, '{self._match_id}')"
 
     def _process_notification(self, match_notification: MatchNotification) -> None:
         """ Process a notification and update game state
@@ -154,27 +257,36 @@ class Match:
         self._game_state = match_notification.game_state
         self._winner = match_notification.winner
 
-    def wait_for_update(self):
-        notification = self._notifications.get()
-        notification.process()
-        try:
-            while True:
-                notification = self._notifications.get_nowait()
-                notification.process()
-        except Empty:
-            pass
+    def _apply_game_state_patch(self, data: dict) -> None:
+        """ Reconstructs the game state in a delta notification
 
-    def next_notification(self) -> Optional[MatchNotification]:
-        """ If there are any unprocessed notifications, returns the next notification
+        If the notification data includes a game state patch,
+        applies it to the last game state received from the server,
+        and adds the resulting game state to the data. This is done
+        as soon as the notification is received (and not when it
+        is processed) because patches must be applied in the order
+        in which they were sent, even if some notifications are
+        never processed.
 
-        Returns: A MatchNotification object if there are any unprocessed
-            notifications. Otherwise, returns None.
+        Args:
+            data: Notification data
+
+        Raises:
+            MalformedResponse: If the patch cannot be applied
+
+        Returns: None
 
         """
-        if not self._notifications.empty():
-            return self._notifications.get_nowait()
-        else:
-            return None
+        if "game-state-patch" in data:
+            if self._last_game_state is None:
+                raise MalformedResponse("Received a game state patch before any game state", data)
+            try:
+                data["game-state"] = apply_patch(self._last_game_state, data["game-state-patch"])
+            except ValueError as ve:
+                raise MalformedResponse(f"Incorrect game state patch ({ve})", data)
+
+        if "game-state" in data:
+            self._last_game_state = data["game-state"]
 
     @property
     def id(self):
@@ -201,6 +313,59 @@ class Match:
         """Get's the gane's state"""
         return self._game_state
 
+    def _game_action_params(self, action: str, data: Optional[dict]) -> Dict[str, Any]:
+        if data is None:
+            data = {}
+        return {"match-id": self.id, "action": action, "data": data}
+
+    def _game_actions_requests(self, actions: List[Tuple[str, Optional[dict]]]) -> List[Tuple[str, Optional[dict]]]:
+        return [("game-action", self._game_action_params(action, data)) for action, data in actions]
+
+
+class Match(BaseMatch):
+    """
+    Class representing a match in the server.
+
+    Should never be instantiated directly.
+    """
+
+    _api: ClientAPI
+    _notifications: Queue
+
+    def __init__(self, api: ClientAPI, game: Game, match_id: str, player_name: str):
+        """ Constructor
+
+        Args:
+            api: API object
+            game: Game object
+            match_id: Match identifier
+            player_name: Player name
+        """
+        super().__init__(api, game, match_id, player_name)
+        self._notifications = Queue()
+
+    def wait_for_update(self):
+        notification = self._notifications.get()
+        notification.process()
+        try:
+            while True:
+                notification = self._notifications.get_nowait()
+                notification.process()
+        except Empty:
+            pass
+
+    def next_notification(self) -> Optional[MatchNotification]:
+        """ If there are any unprocessed notifications, returns the next notification
+
+        Returns: A MatchNotification object if there are any unprocessed
+            notifications. Otherwise, returns None.
+
+        """
+        if not self._notifications.empty():
+            return self._notifications.get_nowait()
+        else:
+            return None
+
     def game_action(self, action: str, data: Optional[dict] = None) -> None:
         """ Requests a game action
 
@@ -217,14 +382,179 @@ class Match:
         Returns: None
 
         """
-        if data is None:
-            data = {}
-
-        params = {"match-id": self.id, "action": action, "data": data}
+        params = self._game_action_params(action, data)
         response = self._api.send_request("game-action", params)
 
         return response["result"]
 
+    def game_actions(self, actions: List[Tuple[str, Optional[dict]]]) -> List[dict]:
+        """ Requests several game actions at once
+
+        The actions are sent to the server together (so this
+        takes a single round trip to the server, instead of one
+        round trip per action), and are performed in order.
+
+        Args:
+            actions: List of (action, data) tuples
+
+        Raises:
+            GameNoSuchAction: If there is no such action in this game
+            GameIncorrectActionData: If the provided data is incorrect
+            GameNotPlayerTurn: If the requested action cannot be performed
+                until it is the player's turn
+
+        Returns:
+            list[dict]: The result of each action (in the same order
+            as the actions)
+        """
+        requests = self._game_actions_requests(actions)
+        responses = self._api.send_requests(requests)
+
+        return [response["result"] for response in responses]
+
+    def resync(self) -> None:
+        """ Requests the full game state from the server
+
+        The server will send an "update" notification with the
+        full game state (even if delta updates were requested
+        when creating or joining the match)
+
+        Raises:
+            IncorrectMatch: If the player is no longer in the match
+
+        Returns: None
+
+        """
+        params = {"match-id": self.id}
+        self._api.send_request("resync-match", params)
+
+
+class AsyncMatch(BaseMatch):
+    """
+    Class representing a match in the server, when using
+    the asyncio client API (AsyncChimera)
+
+    Should never be instantiated directly.
+    """
+
+    _api: AsyncClientAPI
+    _notifications: asyncio.Queue
+
+    def __init__(self, api: AsyncClientAPI, game: AsyncGame, match_id: str, player_name: str):
+        """ Constructor
+
+        Args:
+            api: API object
+            game: Game object
+            match_id: Match identifier
+            player_name: Player name
+        """
+        super().__init__(api, game, match_id, player_name)
+        self._notifications = asyncio.Queue()
+
+    async def wait_for_update(self) -> None:
+        """ Waits until a notification is received, and then processes
+        it (along with any other pending notifications)
+
+        Returns: None
+
+        """
+        notification = await self._notifications.get()
+        notification.process()
+        while not self._notifications.empty():
+            self._notifications.get_nowait().process()
+
+    def next_notification(self) -> Optional[MatchNotification]:
+        """ If there are any unprocessed notifications, returns the next notification
+
+        Returns: A MatchNotification object if there are any unprocessed
+            notifications. Otherwise, returns None.
+
+        """
+        if not self._notifications.empty():
+            return self._notifications.get_nowait()
+        else:
+            return None
+
+    async def notifications(self) -> AsyncIterator[MatchNotification]:
+        """ Iterates over the notifications for this match, as they
+        are received. The notifications are processed (i.e., the state
+        of the match is updated) before they are yielded, and the
+        iteration ends after the "end" notification.
+
+        Examples:
+
+            >>> async for notification in match.notifications():
+            ...     if notification.event == MatchNotification.EVENT_UPDATE:
+            ...         await match.game_action("move", {"col": 0})
+
+        Returns: Asynchronous iterator of MatchNotification objects
+        """
+        while True:
+            notification = await self._notifications.get()
+            notification.process()
+            yield notification
+            if notification.event == MatchNotification.EVENT_END:
+                return
+
+    async def game_action(self, action: str, data: Optional[dict] = None) -> dict:
+        """ Requests a game action
+
+        Args:
+            action: Name of the action to be performed
+            data: Action-specific data
+
+        Raises:
+            GameNoSuchAction: If there is no such action in this game
+            GameIncorrectActionData: If the provided data is incorrect
+            GameNotPlayerTurn: If the requested action cannot be performed
+                until it is the player's turn
+
+        Returns: The result of the action
+
+        """
+        params = self._game_action_params(action, data)
+        response = await self._api.send_request("game-action", params)
+
+        return response["result"]
+
+    async def game_actions(self, actions: List[Tuple[str, Optional[dict]]]) -> List[dict]:
+        """ Requests several game actions at once
+
+        See Match.game_actions
+
+        Args:
+            actions: List of (action, data) tuples
+
+        Raises:
+            GameNoSuchAction: If there is no such action in this game
+            GameIncorrectActionData: If the provided data is incorrect
+            GameNotPlayerTurn: If the requested action cannot be performed
+                until it is the player's turn
+
+        Returns:
+            list[dict]: The result of each action (in the same order
+            as the actions)
+        """
+        requests = self._game_actions_requests(actions)
+        responses = await self._api.send_requests(requests)
+
+        return [response["result"] for response in responses]
+
+    async def resync(self) -> None:
+        """ Requests the full game state from the server
+
+        See Match.resync
+
+        Raises:
+            IncorrectMatch: If the player is no longer in the match
+
+        Returns: None
+
+        """
+        params = {"match-id": self.id}
+        await self._api.send_request("resync-match", params)
+
 
 class MatchNotification:
     """
@@ -237,11 +567,11 @@ class MatchNotification:
     EVENT_UPDATE = "update"
     EVENT_END = "end"
 
-    _match: Match
+    _match: BaseMatch
     _event: str
     _data: dict
 
-    def __init__(self, match: Match, event: str, data: dict):
+    def __init__(self, match: BaseMatch, event: str, data: dict):
         """ Constructor
 
         Args:
@@ -287,7 +617,14 @@ class MatchNotification:
 MatchNotificationCallback = Callable[[MatchNotification], None]
 
 
-class ClientAPI:
+class BaseClientAPI:
+    """
+    Functionality shared by the synchronous and asyncio client APIs
+    (everything except actually sending requests)
+    """
+
+    _matches: Dict[Tuple[str, str], BaseMatch]
+
     def __init__(self, connector, notification_callback):
         self._connector = connector
         self._notification_callback = notification_callback
@@ -315,12 +652,13 @@ class ClientAPI:
 
         event = notification["event"]
         data = notification["data"]
+        match._apply_game_state_patch(data)
         notification = MatchNotification(match, event, data)
 
         if self._notification_callback is not None:
             self._notification_callback(notification)
         else:
-            match._notifications.put(notification)
+            match._notifications.put_nowait(notification)
 
 
     def _raise_error_exception(self, response):
@@ -337,16 +675,14 @@ class ClientAPI:
                               response["error"]["message"],
                               response["error"]["data"])
 
-    def get_games(self) -> Dict[str, Game]:
-        response = self.send_request("list-games")
-
+    def _games_from_response(self, response, game_cls):
         if "games" not in response["result"]:
             raise MalformedResponse("Missing 'games' field", response)
 
         games = {}
         for g in response["result"]["games"]:
             self._validate_response_fields(response, g, ["id", "description"], "game")
-            game = Game(self, g["id"], g["description"])
+            game = game_cls(self, g["id"], g["description"])
             games[game.id] = game
 
         return games
@@ -354,9 +690,7 @@ class ClientAPI:
     def set_notification_callback(self, notification_callback):
         self._notification_callback = notification_callback
 
-    def send_request(self, operation, params=None):
-        response = self._connector.send_request(operation, params)
-
+    def _validate_response(self, response):
         self._validate_response_fields(response, response,
                               ["type", "id"], "response")
 
@@ -369,4 +703,91 @@ class ClientAPI:
         self._validate_response_fields(response, response,
                                        ["result"], "response")
 
+
+class ClientAPI(BaseClientAPI):
+
+    def get_games(self) -> Dict[str, Game]:
+        response = self.send_request("list-games")
+
+        return self._games_from_response(response, Game)
+
+    def send_request(self, operation, params=None):
+        response = self._connector.send_request(operation, params)
+
+        self._validate_response(response)
+
         return response
+
+    def send_requests(self, requests: List[Tuple[str, Optional[dict]]]) -> List[dict]:
+        """ Sends several requests at once
+
+        All the requests are sent to the server in a single message,
+        without waiting for the response to each request before
+        sending the next one.
+
+        Args:
+            requests: List of (operation, params) tuples
+
+        Raises:
+            ErrorResponse: If any of the requests fails, the exception
+                for the first failed request is raised (once the
+                responses to all the requests have been received)
+
+        Returns:
+            list[dict]: The responses, in the same order as the requests
+        """
+        if len(requests) == 0:
+            return []
+
+        responses = self._connector.send_requests(requests)
+
+        for response in responses:
+            self._validate_response(response)
+
+        return responses
+
+
+class AsyncClientAPI(BaseClientAPI):
+    """
+    Client API for use with asyncio. Requests are sent from the
+    caller's event loop, so a single process (and thread) can take
+    part in many matches at once.
+    """
+
+    async def get_games(self) -> Dict[str, AsyncGame]:
+        response = await self.send_request("list-games")
+
+        return self._games_from_response(response, AsyncGame)
+
+    async def send_request(self, operation, params=None):
+        response = await self._connector.send_request(operation, params)
+
+        self._validate_response(response)
+
+        return response
+
+    async def send_requests(self, requests: List[Tuple[str, Optional[dict]]]) -> List[dict]:
+        """ Sends several requests at once
+
+        See ClientAPI.send_requests
+
+        Args:
+            requests: List of (operation, params) tuples
+
+        Raises:
+            ErrorResponse: If any of the requests fails, the exception
+                for the first failed request is raised (once the
+                responses to all the requests have been received)
+
+        Returns:
+            list[dict]: The responses, in the same order as the requests
+        """
+        if len(requests) == 0:
+            return []
+
+        responses = await self._connector.send_requests(requests)
+
+        for response in responses:
+            self._validate_response(response)
+
+        return responses
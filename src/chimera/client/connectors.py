@@ -1,4 +1,3 @@
-import json
 import weakref
 from abc import ABC, abstractmethod
 from asyncio import Future
@@ -9,12 +8,24 @@ import asyncio
 import threading
 
 from chimera.backend.fake import FakeChimeraServer
-from chimera.client import ClientAPI
+from chimera.client.api import BaseClientAPI
+from chimera.common.codec import Codec, DEFAULT_CODEC
+
+
+def create_request(msg_id, operation, params=None):
+    msg = {}
+    msg["type"] = "request"
+    msg["id"] = msg_id
+    msg["operation"] = operation
+    if params is not None:
+        msg["params"] = params
+
+    return msg
 
 
 class BaseConnector(ABC):
 
-    def __init__(self, api: ClientAPI):
+    def __init__(self, api: BaseClientAPI):
         # We need to create this as a weak reference; otherwise,
         # Chimera.__del__ will fail to fully disconnect because
         # this reference will hold up the garbage collector
@@ -28,32 +39,140 @@ class BaseConnector(ABC):
     def _send_msg(self, msg):
         pass
 
+    @abstractmethod
+    def _send_msgs(self, msgs):
+        pass
+
+    def _create_request(self, operation, params=None):
+        return create_request(self._generate_id(), operation, params)
+
     def send_request(self, operation, params=None):
-        msg = {}
-        msg["type"] = "request"
-        msg["id"] = self._generate_id()
-        msg["operation"] = operation
-        if params is not None:
-            msg["params"] = params
+        msg = self._create_request(operation, params)
 
         response = self._send_msg(msg)
 
         return response
 
+    def send_requests(self, requests):
+        # Sends several requests in a single message (a batch),
+        # and returns their responses in the same order as the requests
+        msgs = [self._create_request(operation, params) for operation, params in requests]
+
+        responses = self._send_msgs(msgs)
+
+        return responses
 
-class WebSocketsConnector(BaseConnector):
+
+class WebSocketsConnection:
+    """
+    A websocket connection to a Chimera server. Takes care of
+    sending requests and matching them to their responses, and
+    of handing over notifications to the API object.
+
+    All the coroutines must be run in the same event loop. This
+    class is used by both WebSocketsConnector (which runs the
+    event loop in a separate thread) and AsyncWebSocketsConnector
+    (which runs in the application's event loop).
+    """
 
     _requests: Dict[str, Future]
 
-    def __init__(self, api: ClientAPI, host: str, port: str):
-        super().__init__(api)
+    def __init__(self, api: BaseClientAPI, host: str, port: str, codec: Codec = DEFAULT_CODEC):
+        self._api = weakref.ref(api)
         self._uri = f"ws://{host}:{port}"
+        self._codec = codec
         self._conn = None
-        self._loop = None
-        self._running = False
         self._requests = {}
-        self._recv = None
         self._msg_id = 1
+
+    @property
+    def codec(self):
+        return self._codec
+
+    async def open(self):
+        if self._codec.binary:
+            # Binary encodings have to be negotiated with the
+            # server. If the server doesn't support the encoding
+            # we requested, we fall back to JSON.
+            self._conn = await websockets.connect(self._uri, subprotocols=[self._codec.subprotocol])
+            if self._conn.subprotocol != self._codec.subprotocol:
+                self._codec = DEFAULT_CODEC
+        else:
+            self._conn = await websockets.connect(self._uri)
+
+    async def close(self):
+        await self._conn.close()
+
+    async def rcv_loop(self):
+        try:
+            async for raw_message in self._conn:
+                self._process_msg(raw_message)
+        except websockets.exceptions.ConnectionClosedError:
+            # TODO: Reconnect, or let the API know the connection was lost
+            pass
+        finally:
+            # Any pending requests will never get a response
+            for response_future in self._requests.values():
+                if not response_future.done():
+                    response_future.set_exception(ConnectionError("Connection to Chimera server closed"))
+            self._requests.clear()
+
+        await self._conn.close()
+
+    def _process_msg(self, raw_message):
+        # Responses resolve the future their request is waiting
+        # on, and notifications are handed over to the API, as
+        # soon as they are received.
+        # TODO: Validate JSON and ID
+        msg = self._codec.decode(raw_message)
+        msg_id = msg.get("id")
+        if msg_id is not None:
+            response_future = self._requests.pop(msg_id, None)
+            if response_future is not None and not response_future.done():
+                response_future.set_result(msg)
+        else:
+            api = self._api()
+            if api is not None:
+                api._process_notification(msg)
+
+    def generate_id(self):
+        host, port = self._conn.local_address
+        msg_id = f"{host}:{port}-{self._msg_id:08}"
+        self._msg_id += 1
+
+        return msg_id
+
+    async def send(self, msg):
+        msg_id = msg["id"]
+        response_future = asyncio.get_running_loop().create_future()
+        self._requests[msg_id] = response_future
+        msg_txt = self._codec.encode(msg)
+        await self._conn.send(msg_txt)
+        response = await response_future
+
+        return response
+
+    async def send_batch(self, msgs):
+        loop = asyncio.get_running_loop()
+        response_futures = []
+        for msg in msgs:
+            response_future = loop.create_future()
+            self._requests[msg["id"]] = response_future
+            response_futures.append(response_future)
+        msg_txt = self._codec.encode(msgs)
+        await self._conn.send(msg_txt)
+        responses = await asyncio.gather(*response_futures)
+
+        return list(responses)
+
+
+class WebSocketsConnector(BaseConnector):
+
+    def __init__(self, api: BaseClientAPI, host: str, port: str, codec: Codec = DEFAULT_CODEC):
+        super().__init__(api)
+        self._ws = WebSocketsConnection(api, host, port, codec)
+        self._loop = None
+        self._running = False
         self._thread_exc = None
 
     def _thread(self):
@@ -63,62 +182,17 @@ class WebSocketsConnector(BaseConnector):
 
     async def _rcv_loop(self):
         try:
-            self._conn = await websockets.connect(self._uri)
+            await self._ws.open()
             self._thread_ready.set()
         except ConnectionRefusedError as cre:
             self._thread_exc = cre
             self._thread_ready.set()
             return
 
-        while self._running:
-            try:
-                self._recv = self._loop.create_task(self._conn.recv())
-                msg = await self._recv
-
-                # TODO: Validate JSON and ID
-                msg = json.loads(msg)
-                msg_id = msg.get("id")
-                if msg_id is not None:
-                    response_future = self._requests.get(msg_id)
-                    if response_future is not None:
-                        response_future.set_result(msg)
-                        del self._requests[msg_id]
-                else:
-                    self._api()._process_notification(msg)
-
-                # TODO: Some messages seem to not be delivered unless
-                #       we allow for a short delay here. In theory, it should
-                #       be enough to call asyncuo.sleep(0) to yield to the
-                #       scheduler, but that doesn't seem to work.
-                await asyncio.sleep(0.01)
-            except websockets.exceptions.ConnectionClosedOK:
-                # TODO
-                break
-            except websockets.exceptions.ConnectionClosedError:
-                # TODO
-                break
-            except asyncio.CancelledError:
-                # TODO
-                break
-
-        await self._conn.close()
-
-    async def _send(self, msg):
-        msg_id = msg["id"]
-        response_future = self._loop.create_future()
-        self._requests[msg_id] = response_future
-        msg_txt = json.dumps(msg)
-        await self._conn.send(msg_txt)
-        response = await response_future
-
-        return response
+        await self._ws.rcv_loop()
 
     def _generate_id(self):
-        host, port = self._conn.local_address
-        msg_id = f"{host}:{port}-{self._msg_id:08}"
-        self._msg_id += 1
-
-        return msg_id
+        return self._ws.generate_id()
 
     def connect(self):
         self._running = True
@@ -135,22 +209,64 @@ class WebSocketsConnector(BaseConnector):
 
     def disconnect(self):
         if self._running:
-            self._api = None
             self._running = False
-            self._loop.call_soon_threadsafe(self._recv.cancel)
+            # Closing the connection will end the receive loop
+            # (unless the server already closed the connection)
+            if self._thread.is_alive():
+                asyncio.run_coroutine_threadsafe(self._ws.close(), self._loop)
             self._thread.join()
 
-    def _send_msg(self, msg):
+    def _run_in_thread(self, coro):
         # TODO: Add support for sending messages from inside callback functions
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
             loop = None
         if loop == self._loop:
-            raise RuntimeError("Sending messages from a callback function is not currently supported")
-        task = asyncio.run_coroutine_threadsafe(self._send(msg), self._loop)
+            coro.close()
+            raise RuntimeError("Sending messages from a callback function is not currently supported "
+                               "(use AsyncChimera instead)")
+        task = asyncio.run_coroutine_threadsafe(coro, self._loop)
         return task.result()
 
+    def _send_msg(self, msg):
+        return self._run_in_thread(self._ws.send(msg))
+
+    def _send_msgs(self, msgs):
+        return self._run_in_thread(self._ws.send_batch(msgs))
+
+
+class AsyncWebSocketsConnector:
+    """
+    Connector for the asyncio client API. Unlike the other
+    connectors, it runs in the application's event loop, so
+    sending a request does not involve any other threads.
+    """
+
+    def __init__(self, api: BaseClientAPI, host: str, port: str, codec: Codec = DEFAULT_CODEC):
+        self._ws = WebSocketsConnection(api, host, port, codec)
+        self._rcv_task = None
+
+    async def connect(self):
+        await self._ws.open()
+        self._rcv_task = asyncio.create_task(self._ws.rcv_loop())
+
+    async def disconnect(self):
+        if self._rcv_task is not None:
+            await self._ws.close()
+            await self._rcv_task
+            self._rcv_task = None
+
+    async def send_request(self, operation, params=None):
+        msg = create_request(self._ws.generate_id(), operation, params)
+
+        return await self._ws.send(msg)
+
+    async def send_requests(self, requests):
+        msgs = [create_request(self._ws.generate_id(), operation, params) for operation, params in requests]
+
+        return await self._ws.send_batch(msgs)
+
 
 class FakeConnector(BaseConnector):
 
@@ -170,12 +286,19 @@ class FakeConnector(BaseConnector):
         return msg_id
 
     def _send_msg(self, msg):
-        msg = json.dumps(msg)
+        msg = self.server.codec.encode(msg)
         asyncio.run(self.server.fake_send_message(self.client, msg))
         response = next(self.client.responses)
 
         return response
 
+    def _send_msgs(self, msgs):
+        raw_msgs = self.server.codec.encode(msgs)
+        asyncio.run(self.server.fake_send_message(self.client, raw_msgs))
+        responses = {response["id"]: response for response in self.client.responses}
+
+        return [responses[msg["id"]] for msg in msgs]
+
     def add_game(self, game_id, game_cls, description):
         self.server.register_game(game_id, game_cls, description)
 
@@ -0,0 +1,244 @@
+"""
+Codecs for encoding and decoding Chimera messages.
+
+The codecs in CODECS all produce and accept the same JSON
+messages, but some of them rely on third-party libraries (orjson,
+msgspec, ujson) that are much faster than Python's json module.
+Those libraries are optional: only the codecs whose library is
+installed are included in CODECS, and DEFAULT_CODEC will be the
+fastest of them.
+
+Clients can also negotiate a binary encoding (currently only
+MessagePack, if the msgpack library is installed) through the
+WebSocket subprotocol. SUBPROTOCOL_CODECS maps each supported
+subprotocol to its codec.
+"""
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Union
+
+
+class DecodeError(ValueError):
+    """
+    Raised when a codec is unable to decode a message
+    """
+
+    def __init__(self, details: str):
+        super().__init__(details)
+        self.details = details
+
+
+class Codec(ABC):
+    """
+    Base class for codecs.
+    """
+
+    # Name used to select the codec (e.g., from the command line)
+    name: str
+
+    # If True, encode() returns bytes (to be sent as binary
+    # websocket frames). Otherwise, it returns a str (to be
+    # sent as text frames).
+    binary: bool = False
+
+    # Name of the encoding (used in error messages)
+    encoding: str = "JSON"
+
+    # WebSocket subprotocol used to negotiate this codec
+    subprotocol: str = "chimera.json"
+
+    @abstractmethod
+    def encode(self, msg: Any) -> Union[str, bytes]:
+        """ Encodes a message
+
+        Args:
+            msg: Message to encode (a JSON-serializable value)
+
+        Returns: Encoded message
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, raw_message: Union[str, bytes]) -> Any:
+        """ Decodes a message
+
+        Args:
+            raw_message: Encoded message
+
+        Raises:
+            DecodeError: If the message cannot be decoded
+
+        Returns: The decoded message
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibJSONCodec(Codec):
+    """
+    JSON codec using Python's json module
+    """
+
+    name = "json"
+
+    def encode(self, msg: Any) -> str:
+        return json.dumps(msg)
+
+    def decode(self, raw_message: Union[str, bytes]) -> Any:
+        try:
+            return json.loads(raw_message)
+        except json.JSONDecodeError as json_exc:
+            raise DecodeError(f"parsing failed at line {json_exc.lineno} column {json_exc.colno}")
+        except UnicodeDecodeError:
+            raise DecodeError("message is not valid UTF-8")
+
+
+CODECS: Dict[str, Codec] = {StdlibJSONCodec.name: StdlibJSONCodec()}
+
+# Names of the codecs, from fastest to slowest
+_PREFERENCE: List[str] = ["orjson", "msgspec", "ujson", "json"]
+
+
+try:
+    import orjson  # type: ignore
+
+    class OrjsonCodec(Codec):
+        """
+        JSON codec using orjson
+        """
+
+        name = "orjson"
+
+        def encode(self, msg: Any) -> str:
+            # orjson produces UTF-8 bytes, but JSON messages
+            # have to be sent as text frames
+            return orjson.dumps(msg).decode("utf-8")
+
+        def decode(self, raw_message: Union[str, bytes]) -> Any:
+            try:
+                return orjson.loads(raw_message)
+            except orjson.JSONDecodeError as json_exc:
+                raise DecodeError(f"parsing failed at line {json_exc.lineno} column {json_exc.colno}")
+
+    CODECS[OrjsonCodec.name] = OrjsonCodec()
+except ImportError:
+    pass
+
+
+try:
+    import msgspec  # type: ignore
+
+    class MsgspecJSONCodec(Codec):
+        """
+        JSON codec using msgspec
+        """
+
+        name = "msgspec"
+
+        def __init__(self) -> None:
+            self._encoder = msgspec.json.Encoder()
+            self._decoder = msgspec.json.Decoder()
+
+        def encode(self, msg: Any) -> str:
+            return self._encoder.encode(msg).decode("utf-8")
+
+        def decode(self, raw_message: Union[str, bytes]) -> Any:
+            try:
+                return self._decoder.decode(raw_message)
+            except msgspec.DecodeError as decode_exc:
+                raise DecodeError(str(decode_exc))
+
+    CODECS[MsgspecJSONCodec.name] = MsgspecJSONCodec()
+except ImportError:
+    pass
+
+
+try:
+    import ujson  # type: ignore
+
+    class UjsonCodec(Codec):
+        """
+        JSON codec using ujson
+        """
+
+        name = "ujson"
+
+        def encode(self, msg: Any) -> str:
+            return ujson.dumps(msg)
+
+        def decode(self, raw_message: Union[str, bytes]) -> Any:
+            try:
+                return ujson.loads(raw_message)
+            except ValueError as value_exc:
+                raise DecodeError(str(value_exc))
+
+    CODECS[UjsonCodec.name] = UjsonCodec()
+except ImportError:
+    pass
+
+
+DEFAULT_CODEC: Codec = next(CODECS[name] for name in _PREFERENCE if name in CODECS)
+
+
+# Codecs for binary encodings, indexed by their WebSocket
+# subprotocol. If a client doesn't request a subprotocol (or
+# requests the JSON subprotocol), the server will use its
+# JSON codec.
+SUBPROTOCOL_CODECS: Dict[str, Codec] = {}
+
+try:
+    import msgpack  # type: ignore
+
+    class MsgpackCodec(Codec):
+        """
+        MessagePack codec using msgpack. The messages have
+        the same structure as the JSON messages.
+        """
+
+        name = "msgpack"
+        binary = True
+        encoding = "MessagePack"
+        subprotocol = "chimera.msgpack"
+
+        def encode(self, msg: Any) -> bytes:
+            return msgpack.packb(msg)
+
+        def decode(self, raw_message: Union[str, bytes]) -> Any:
+            if isinstance(raw_message, str):
+                raise DecodeError("expected a binary message")
+            try:
+                return msgpack.unpackb(raw_message)
+            except (ValueError, msgpack.UnpackException) as unpack_exc:
+                raise DecodeError(f"unpacking failed ({type(unpack_exc).__name__})")
+
+    SUBPROTOCOL_CODECS[MsgpackCodec.subprotocol] = MsgpackCodec()
+except ImportError:
+    pass
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """ Gets a codec by name
+
+    Args:
+        name: Codec name. If None, returns the default codec.
+
+    Raises:
+        ValueError: If there is no such codec (or the library
+            it relies on is not installed)
+
+    Returns: Codec object
+    """
+    if name is None:
+        return DEFAULT_CODEC
+
+    codecs = dict(CODECS)
+    for codec in SUBPROTOCOL_CODECS.values():
+        codecs[codec.name] = codec
+
+    if name not in codecs:
+        raise ValueError(f"Unknown or unavailable codec: {name} "
+                         f"(available codecs: {', '.join(codecs)})")
+
+    return codecs[name]
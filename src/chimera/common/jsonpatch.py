@@ -0,0 +1,142 @@
+"""
+Functions for computing and applying JSON-patch-style diffs
+(a subset of RFC 6902, using only the "add", "remove", and
+"replace" operations) between JSON-serializable values.
+"""
+from typing import Any, Dict, List
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _same(old: Any, new: Any) -> bool:
+    # We also check the type because, in Python, True == 1
+    return type(old) is type(new) and old == new
+
+
+def make_patch(old: Any, new: Any) -> List[Dict[str, Any]]:
+    """ Computes a patch that will transform one value into another
+
+    Objects are compared member by member, and arrays element
+    by element (if an array has grown or shrunk, elements are
+    added to or removed from its end). Anything else is replaced
+    as a whole.
+
+    Args:
+        old: Original value
+        new: New value
+
+    Returns:
+        list[dict]: List of patch operations. Applying these
+        operations to ``old`` (with apply_patch) will produce
+        a value equal to ``new``.
+    """
+    patch: List[Dict[str, Any]] = []
+    _diff(old, new, "", patch)
+    return patch
+
+
+def _diff(old: Any, new: Any, path: str, patch: List[Dict[str, Any]]) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            key_path = f"{path}/{_escape(key)}"
+            if key not in old:
+                patch.append({"op": "add", "path": key_path, "value": value})
+            else:
+                _diff(old[key], value, key_path, patch)
+    elif isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        for i in range(common):
+            _diff(old[i], new[i], f"{path}/{i}", patch)
+        for i in range(common, len(new)):
+            patch.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        for i in reversed(range(common, len(old))):
+            patch.append({"op": "remove", "path": f"{path}/{i}"})
+    elif not _same(old, new):
+        patch.append({"op": "replace", "path": path, "value": new})
+
+
+def apply_patch(doc: Any, patch: List[Dict[str, Any]]) -> Any:
+    """ Applies a patch to a value
+
+    The original value is not modified. Instead, the objects
+    and arrays along the path of each operation are copied, so
+    the result may share unmodified parts with the original value.
+
+    Args:
+        doc: Value to apply the patch to
+        patch: List of patch operations, as returned by make_patch
+
+    Raises:
+        ValueError: If the patch is malformed or cannot be applied
+            to the value.
+
+    Returns:
+        The patched value
+    """
+    copied = set()
+
+    def copy_of(container):
+        if id(container) in copied:
+            return container
+        new_container = container.copy()
+        copied.add(id(new_container))
+        return new_container
+
+    for op in patch:
+        try:
+            op_name = op["op"]
+            path = op["path"]
+        except (KeyError, TypeError):
+            raise ValueError(f"Malformed patch operation: {op}")
+
+        if path == "":
+            if op_name != "replace":
+                raise ValueError(f"Unsupported operation on whole document: {op_name}")
+            doc = op["value"]
+            continue
+
+        if not path.startswith("/"):
+            raise ValueError(f"Incorrect path: {path}")
+
+        tokens = [_unescape(t) for t in path[1:].split("/")]
+
+        try:
+            doc = copy_of(doc)
+            parent = doc
+            for token in tokens[:-1]:
+                key = int(token) if isinstance(parent, list) else token
+                child = copy_of(parent[key])
+                parent[key] = child
+                parent = child
+
+            last = tokens[-1]
+            if isinstance(parent, list):
+                index = len(parent) if last == "-" else int(last)
+                if op_name == "add":
+                    parent.insert(index, op["value"])
+                elif op_name == "remove":
+                    del parent[index]
+                elif op_name == "replace":
+                    parent[index] = op["value"]
+                else:
+                    raise ValueError(f"Unsupported operation: {op_name}")
+            else:
+                if op_name in ("add", "replace"):
+                    parent[last] = op["value"]
+                elif op_name == "remove":
+                    del parent[last]
+                else:
+                    raise ValueError(f"Unsupported operation: {op_name}")
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            raise ValueError(f"Cannot apply operation {op}: {e!r}")
+
+    return doc
@@ -1,6 +1,5 @@
-import copy
 from enum import Enum
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from chimera.exceptions import IncorrectMove, IncorrectActionData
 from chimera.authoring import TwoPlayerGame, TwoPlayerTurnBasedGame
@@ -16,14 +15,26 @@ Enum type for representing piece colors.
 class ConnectMBoard:
     """
     Class for representing a Connect-M board
+
+    Internally, the board is stored as a pair of bitboards (one
+    integer per color). Each column takes up nrows+1 bits, with
+    bit ``col * (nrows + 1) + row`` corresponding to the location
+    (row, col), where rows are numbered from 0 starting at the bottom
+    of the board. The extra (always empty) bit at the top of each
+    column acts as a sentinel that prevents contiguous pieces
+    from "wrapping around" from one column to the next, which
+    allows us to check for winners with a few shifts and ANDs.
     """
 
     #
     # PRIVATE ATTRIBUTES
     #
 
-    # The board itself
-    _board: List[List[Optional[PieceColor]]]
+    # One bitboard per color
+    _bitboards: Dict[PieceColor, int]
+
+    # Row index of the next free location in each column
+    _top: List[int]
 
     # Number of rows and columns
     _nrows: int
@@ -35,6 +46,21 @@ class ConnectMBoard:
     # The winner (if any) on the board
     _winner: Optional[PieceColor]
 
+    # Number of bits used by each column (nrows + the sentinel bit)
+    _height: int
+
+    # Bit shifts for each of the four directions in which
+    # we can have M contiguous pieces
+    _shifts: List[int]
+
+    # For each direction, a mask with M bits set, spaced by
+    # the shift for that direction (used to check whether a run
+    # of pieces includes a specific location)
+    _run_masks: List[int]
+
+    # Mask with all the (non-sentinel) locations in the board
+    _full_mask: int
+
     #
     # PUBLIC METHODS
     #
@@ -54,22 +80,33 @@ class ConnectMBoard:
         if ncols < m:
             raise ValueError(f"Number of columns ({ncols}) must be at least M ({m}")
 
-        self._board = [[None] * ncols for _ in range(nrows)]
+        self._bitboards = {color: 0 for color in PieceColor}
         self._top = [0] * ncols
         self._nrows = nrows
         self._ncols = ncols
         self._m = m
         self._winner = None
 
+        # Vertical, horizontal, diagonal /, and diagonal \
+        self._height = nrows + 1
+        self._shifts = [1, self._height, self._height + 1, self._height - 1]
+        self._run_masks = []
+        for shift in self._shifts:
+            run_mask = 0
+            for i in range(m):
+                run_mask |= 1 << (i * shift)
+            self._run_masks.append(run_mask)
+
+        column_mask = (1 << nrows) - 1
+        self._full_mask = 0
+        for col in range(ncols):
+            self._full_mask |= column_mask << (col * self._height)
+
     def __str__(self) -> str:
         """ Returns a string representation of the board """
         s = "-" * self._ncols + "\n"
-        for row in self._board:
-            for value in row:
-                if value is None:
-                    s += " "
-                else:
-                    s += value.name[0]
+        for row in self.to_str_grid():
+            s += "".join(row)
             s += "\n"
         s += "-" * self._ncols
 
@@ -117,14 +154,13 @@ class ConnectMBoard:
         if not self.can_drop(col):
             return False
 
-        # Temporarily drop the piece into the column,
-        # check if there is a winner, and undo the drop
-        row = self._top[col]
-        self._set(row, col, color)
-        winner = self._winner_at(row, col)
-        self._set(row, col, None)
+        # Check for a winner on a copy of the color's bitboard
+        # with the piece added to it (the board itself is
+        # never modified)
+        bit = self._bit_index(self._top[col], col)
+        bitboard = self._bitboards[color] | (1 << bit)
 
-        return winner
+        return self._winner_at(bitboard, bit)
 
     def drop(self, col: int, color: PieceColor) -> None:
         """ Drops a piece in a column
@@ -143,11 +179,11 @@ class ConnectMBoard:
         if not self.can_drop(col):
             raise ValueError(f"Cannot drop a piece in column {col}")
 
-        row = self._top[col]
-        self._set(row, col, color)
+        bit = self._bit_index(self._top[col], col)
+        self._bitboards[color] |= 1 << bit
         self._top[col] += 1
 
-        if self._winner_at(row, col):
+        if self._winner_at(self._bitboards[color], bit):
             self._winner = color
 
     def reset(self) -> None:
@@ -158,9 +194,8 @@ class ConnectMBoard:
         Returns: None
 
         """
-        for row in self._board:
-            for i, _ in enumerate(row):
-                row[i] = None
+        for color in self._bitboards:
+            self._bitboards[color] = 0
 
         for i, _ in enumerate(self._top):
             self._top[i] = 0
@@ -182,11 +217,8 @@ class ConnectMBoard:
         if self.get_winner() is not None:
             return True
         else:
-            # Check if all the columns are full
-            for top_row in self._top:
-                if top_row < self._nrows:
-                    return False
-            return True
+            # Check if all the locations are taken
+            return self._occupied() == self._full_mask
 
     def get_winner(self) -> Optional[PieceColor]:
         """ Returns the winner (if any) in the board
@@ -214,10 +246,8 @@ class ConnectMBoard:
             in the list will be None (no piece), PieceColor.RED
             (red piece), or PieceColor.YELLOW (yellow piece)
         """
-
-        # The expected return type happens to be our internal
-        # representation for the board, so we just return a copy
-        return copy.deepcopy(self._board)
+        return [[self._get(row, col) for col in range(self._ncols)]
+                for row in reversed(range(self._nrows))]
 
     def to_str_grid(self) -> List[List[str]]:
         """ Returns the board as a list of list of strings
@@ -231,7 +261,7 @@ class ConnectMBoard:
             or "Y" (yellow piece)
         """
         rv = []
-        for row in self._board:
+        for row in self.to_piece_grid():
             lst = []
             for value in row:
                 if value is None:
@@ -245,6 +275,25 @@ class ConnectMBoard:
     # PRIVATE METHODS
     #
 
+    def _bit_index(self, row: int, col: int) -> int:
+        """ Returns the index of the bit for a given location
+
+        Args:
+            row (int): Row index (0 is the bottom of the board)
+            col (int): Column index
+
+        Returns:
+            int: Bit index
+        """
+        return col * self._height + row
+
+    def _occupied(self) -> int:
+        """ Returns a bitboard with all the occupied locations """
+        occupied = 0
+        for bitboard in self._bitboards.values():
+            occupied |= bitboard
+        return occupied
+
     def _get(self, row: int, col: int) -> Optional[PieceColor]:
         """ Gets piece color (if any) at a given location.
 
@@ -264,94 +313,52 @@ class ConnectMBoard:
             return None
         elif not (0 <= col < self._ncols):
             return None
-        else:
-            return self._board[(self._nrows - 1) - row][col]
 
-    def _set(self, row: int, col: int, color: Optional[PieceColor]) -> None:
-        """ Sets piece color at a given location.
+        bit = 1 << self._bit_index(row, col)
+        for color, bitboard in self._bitboards.items():
+            if bitboard & bit:
+                return color
 
-        Rows are numbered from 0 starting at the bottom of the board.
+        return None
 
-        Args:
-            row (int): Row index
-            col (int): Column index
-            color (Optional[PieceColor]): Color to set the location to.
-              Can also be None to clear the piece in that location.
-
-        Raises:
-            ValueError: If the provided location is not valid
-
-        Returns: None
-        """
-        assert 0 <= row < self._nrows
-        assert 0 <= col < self._ncols
-
-        self._board[(self._nrows - 1) - row][col] = color
-
-    def _winner_at(self, row: int, col: int) -> bool:
+    def _winner_at(self, bitboard: int, bit: int) -> bool:
         """ Checks for a winner at a location
 
-        Checks whether the specified location contains
-        a winning row, column, or diagonal.
+        Checks whether the specified location is part of
+        M contiguous pieces in a bitboard (along a row, column,
+        or diagonal).
 
         Args:
-            row (int): Row index
-            col (int): Column index
+            bitboard (int): Bitboard for a single color
+            bit (int): Bit index of the location
 
         Returns:
             bool: True if there is a winner at the specified
             location. False otherwise.
         """
-
-        dirs = [(+1, -1), (+1, 0), (+1, +1),
-                ( 0, -1),          ( 0, +1),
-                (-1, -1), (-1, 0), (-1, +1)]
-
-        # For every possible direction, count the number
-        # of adjacent pieces, up to a maximum on m-1
-        adj_dir = {}
-        origin_piece = self._get(row, col)
-        for dr, dc in dirs:
-            adj_dir[(dr, dc)] = 0
-
-            # Start at the 'origin' (row, col)
-            ir, ic = row, col
-            for _ in range(self._m-1):
-                # At each step, add the direction (dr, dc)
-                # Get the piece at that location, and compare
-                # it with the original piece
-                ir, ic = ir + dr, ic + dc
-                piece = self._get(ir, ic)
-                if piece == origin_piece:
-                    adj_dir[(dr, dc)] += 1
-                else:
+        for shift, run_mask in zip(self._shifts, self._run_masks):
+            # After ANDing the bitboard with itself shifted
+            # 1..M-1 times, a bit will be set only if it is the
+            # start of M contiguous pieces in this direction.
+            runs = bitboard
+            for i in range(1, self._m):
+                runs &= bitboard >> (i * shift)
+                if runs == 0:
                     break
 
-            # If there are M-1 adjacent pieces in this
-            # direction, we know we have a winner.
-            if adj_dir[(dr, dc)] == self._m - 1:
-                return True
-
-        # If after looking in each direction we didn't see
-        # M contiguous piece, we now need to check whether
-        # adding the contiguous pieces along a row, column,
-        # or the two diagonals yields a winner.
+            if runs == 0:
+                continue
 
-        # Rows
-        if adj_dir[(0, -1)] + 1 + adj_dir[(0, +1)] >= self._m:
-            return True
+            # The location is part of a run if that run starts
+            # at most M-1 steps "behind" the location.
+            offset = bit - (self._m - 1) * shift
+            if offset >= 0:
+                window = run_mask << offset
+            else:
+                window = run_mask >> -offset
 
-        # Columns
-        if adj_dir[(+1, 0)] + 1 + adj_dir[(-1, 0)] >= self._m:
-            return True
-
-        # Diagonal \
-        if adj_dir[(+1, -1)] + 1 + adj_dir[(-1, +1)] >= self._m:
-            return True
-
-        # Diagonal /
-        if adj_dir[(-1, -1)] + 1 + adj_dir[(+1, +1)] >= self._m:
-            return True
+            if runs & window:
+                return True
 
         return False
 
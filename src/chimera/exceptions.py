@@ -119,6 +119,14 @@ class DuplicatePlayer(ErrorResponse):
     pass
 
 
+class IncorrectMatch(ErrorResponse):
+    """
+    Raised when a player sends a request for a match they are
+    not in (or that no longer exists)
+    """
+    pass
+
+
 class GameNoSuchAction(ErrorResponse):
     """
     Raised when a game action is sent to a match, but the game does
@@ -151,6 +159,7 @@ ERROR_EXCEPTIONS = {
     ErrorCode.ALREADY_IN_MATCH.value: AlreadyInAMatch,
     ErrorCode.UNKNOWN_MATCH.value: UnknownMatch,
     ErrorCode.DUPLICATE_PLAYER.value: DuplicatePlayer,
+    ErrorCode.INCORRECT_MATCH.value: IncorrectMatch,
     ErrorCode.GAME_NO_SUCH_ACTION.value: GameNoSuchAction,
     ErrorCode.GAME_INCORRECT_ACTION_DATA.value: GameIncorrectActionData,
     ErrorCode.GAME_NOT_PLAYER_TURN.value: GameNotPlayerTurn,
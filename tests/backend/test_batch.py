@@ -0,0 +1,68 @@
+import pytest
+import json
+
+from chimera.common import ErrorCode
+
+from chimera.examples.chicken import Chicken
+from chimera.examples.p1wins import PlayerOneWins
+
+from tests.common.fixtures import test_server
+from tests.common.utils import create_request_msg
+
+
+@pytest.mark.asyncio
+async def test_batch(test_server):
+    games = [("p1-wins", PlayerOneWins, "Player One Wins"),
+             ("chicken", Chicken, "Chicken")]
+
+    c1, c2, m = await test_server.setup_match(games, "p1-wins", "Alex", "Sam")
+
+    batch = [create_request_msg("list-games", 100),
+             create_request_msg("game-action", 101, {"match-id": m, "action": "move", "data": {"phrase": "Test"}}),
+             create_request_msg("game-action", 102, {"match-id": m, "action": "move", "data": {"phrase": "Test"}})]
+    await test_server.fake_send_message(c1, json.dumps(batch))
+
+    assert c1.num_responses == 3
+    responses = list(c1.responses)
+
+    # Requests are processed in order
+    assert [r["id"] for r in responses] == [100, 101, 102]
+    assert len(responses[0]["result"]["games"]) == 2
+    assert responses[1]["result"] == {"received": "Test"}
+    assert responses[2]["error"]["code"] == ErrorCode.GAME_NOT_PLAYER_TURN.value
+
+
+@pytest.mark.asyncio
+async def test_batch_incorrect_requests(test_server):
+    client = test_server.create_client()
+
+    batch = [create_request_msg("list-games", 100),
+             {"type": "request"},
+             42,
+             create_request_msg("foobar", 101)]
+    await test_server.fake_send_message(client, json.dumps(batch))
+
+    assert client.num_responses == 4
+    responses = list(client.responses)
+
+    # Errors for incorrect requests are sent while the batch
+    # is being validated (before any requests are processed)
+    assert responses[0]["error"]["code"] == ErrorCode.INCORRECT_REQUEST.value
+    assert responses[1]["error"]["code"] == ErrorCode.INCORRECT_REQUEST.value
+    assert responses[2]["id"] == 101
+    assert responses[2]["error"]["code"] == ErrorCode.NO_SUCH_OPERATION.value
+    assert responses[3]["id"] == 100
+    assert responses[3]["result"] == {"games": []}
+
+
+@pytest.mark.asyncio
+async def test_batch_empty(test_server):
+    client = test_server.create_client()
+
+    await test_server.fake_send_message(client, "[]")
+
+    assert client.num_responses == 1
+    msg = next(client.responses)
+
+    assert msg["id"] is None
+    assert msg["error"]["code"] == ErrorCode.INCORRECT_REQUEST.value
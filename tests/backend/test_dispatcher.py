@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from chimera.backend.dispatcher import RequestDispatcher
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_same_key_in_order():
+    dispatcher = RequestDispatcher(8)
+    processed = []
+
+    async def request(i, delay):
+        await asyncio.sleep(delay)
+        processed.append(i)
+
+    # Earlier requests take longer, but must still finish first
+    for i in range(5):
+        await dispatcher.submit("match-1", request, i, 0.01 * (5 - i))
+
+    await dispatcher.wait_all()
+
+    assert processed == [0, 1, 2, 3, 4]
+    assert dispatcher.num_pending == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_unordered_overlaps():
+    dispatcher = RequestDispatcher(8)
+    release = asyncio.Event()
+    processed = []
+
+    async def slow_request():
+        await release.wait()
+        processed.append("slow")
+
+    async def fast_request():
+        processed.append("fast")
+        release.set()
+
+    await dispatcher.submit("match-1", slow_request)
+    await dispatcher.submit(RequestDispatcher.UNORDERED, fast_request)
+    await dispatcher.wait_all()
+
+    assert processed == ["fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_bounded():
+    dispatcher = RequestDispatcher(2)
+    release = asyncio.Event()
+
+    async def request():
+        await release.wait()
+
+    await dispatcher.submit(RequestDispatcher.UNORDERED, request)
+    await dispatcher.submit(RequestDispatcher.UNORDERED, request)
+    assert dispatcher.num_pending == 2
+
+    # A third request has to wait for one of the others to finish
+    submit_task = asyncio.create_task(dispatcher.submit(RequestDispatcher.UNORDERED, request))
+    await asyncio.sleep(0.01)
+    assert not submit_task.done()
+
+    release.set()
+    await submit_task
+    await dispatcher.wait_all()
+    assert dispatcher.num_pending == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_exception_does_not_block_key():
+    dispatcher = RequestDispatcher(4)
+    processed = []
+
+    async def failing_request():
+        raise RuntimeError("Request failed")
+
+    async def request():
+        processed.append("ok")
+
+    await dispatcher.submit("match-1", failing_request)
+    await dispatcher.submit("match-1", request)
+    await dispatcher.wait_all()
+
+    assert processed == ["ok"]
@@ -1,8 +1,10 @@
 import pytest
 import json
 
+from chimera.backend.fake import FakeChimeraServer
 from tests.common.fixtures import test_server
 from chimera.common import ErrorCode
+from chimera.common.codec import CODECS
 
 
 @pytest.mark.asyncio
@@ -83,3 +85,18 @@ async def test_incorrect_operation(test_server):
     assert msg["id"] == "42"
     assert msg["error"]["code"] == ErrorCode.NO_SUCH_OPERATION.value
     assert msg["error"]["message"] == str(ErrorCode.NO_SUCH_OPERATION)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec_name", list(CODECS))
+async def test_incorrect_json_codecs(codec_name):
+    server = FakeChimeraServer(codec=CODECS[codec_name])
+    client = server.create_client()
+
+    await server.fake_send_message(client, '{"foo": }')
+
+    assert client.num_responses == 1
+    msg = next(client.responses)
+
+    assert msg["error"]["code"] == ErrorCode.PARSE_ERROR.value
+    assert msg["error"]["data"]["details"].startswith("Incorrect JSON")
@@ -1,6 +1,10 @@
+import json
+
 import pytest
 
-from tests.common.utils import validate_notification
+from chimera.backend.server import BaseConnectedClient
+from chimera.common import ErrorCode
+from tests.common.utils import validate_notification, create_request_msg
 
 from chimera.examples.chicken import Chicken
 from chimera.examples.p1wins import PlayerOneWins
@@ -90,4 +94,98 @@ async def test_notification_end(test_server):
                               expect_match_status="done",
                               expect_match_winner="Alex",
                               expect_game_id="p1-wins",
-                              expect_game_state=expect_game_state)
\ No newline at end of file
+                              expect_game_state=expect_game_state)
+
+@pytest.mark.asyncio
+async def test_notification_update_delta(test_server):
+    games = [("p1-wins", PlayerOneWins, "Player One Wins"),
+             ("chicken", Chicken, "Chicken")]
+
+    c1, c2, m = await test_server.setup_match(games, "chicken", "Alex", "Sam", delta_updates=(True, False))
+
+    # 'start' notifications always include the full game state
+    for c in (c1, c2):
+        notification = next(c.notifications)
+        validate_notification(notification,
+                              expect_event="start",
+                              expect_game_state={"p1_points": 0, "p2_points": 0, "rounds": []})
+
+    await test_server.game_action(c1, m, "move", {"swerve": True})
+    await test_server.game_action(c2, m, "move", {"swerve": False})
+
+    expect_round = {"p1_swerve": True, "p2_swerve": False, "p1_points": 0, "p2_points": 3}
+
+    # Alex requested delta updates
+    assert c1.num_notifications == 1
+    notification = next(c1.notifications)
+    validate_notification(notification,
+                          expect_event="update",
+                          expect_match_id=m,
+                          expect_match_status="in-progress")
+    assert "game-state" not in notification["data"]
+    assert notification["data"]["game-state-patch"] == [
+        {"op": "replace", "path": "/p2_points", "value": 3},
+        {"op": "add", "path": "/rounds/0", "value": expect_round}
+    ]
+
+    # Sam did not
+    assert c2.num_notifications == 1
+    notification = next(c2.notifications)
+    validate_notification(notification,
+                          expect_event="update",
+                          expect_game_state={"p1_points": 0, "p2_points": 3, "rounds": [expect_round]})
+    assert "game-state-patch" not in notification["data"]
+
+
+@pytest.mark.asyncio
+async def test_resync_match(test_server):
+    games = [("p1-wins", PlayerOneWins, "Player One Wins"),
+             ("chicken", Chicken, "Chicken")]
+
+    c1, c2, m = await test_server.setup_match(games, "p1-wins", "Alex", "Sam", delta_updates=(True, True))
+
+    # Skip 'start' notifications
+    next(c1.notifications)
+    next(c2.notifications)
+
+    await test_server.fake_send_message(c1, json.dumps(create_request_msg("resync-match", 100, {"match-id": m})))
+
+    assert next(c1.responses)["result"] == {}
+    assert c1.num_notifications == 1
+    validate_notification(next(c1.notifications),
+                          expect_event="update",
+                          expect_game_state={'player1_phrase': None, 'player2_phrase': None})
+    assert c2.num_notifications == 0
+
+    c3 = test_server.create_client()
+    await test_server.fake_send_message(c3, json.dumps(create_request_msg("resync-match", 101, {"match-id": m})))
+
+    response = next(c3.responses)
+    assert response["error"]["code"] == ErrorCode.INCORRECT_MATCH.value
+
+
+@pytest.mark.asyncio
+async def test_notification_encoded_once(test_server, monkeypatch):
+    games = [("p1-wins", PlayerOneWins, "Player One Wins"),
+             ("chicken", Chicken, "Chicken")]
+
+    c1, c2, m = await test_server.setup_match(games, "p1-wins", "Alex", "Sam")
+
+    # Skip 'start' notifications
+    next(c1.notifications)
+    next(c2.notifications)
+
+    encoded = []
+    encode_msg = BaseConnectedClient._encode_msg
+
+    def counting_encode_msg(client, msg):
+        encoded.append(msg["type"])
+        return encode_msg(client, msg)
+
+    monkeypatch.setattr(BaseConnectedClient, "_encode_msg", counting_encode_msg)
+
+    await test_server.game_action(c1, m, "move", {"phrase": "Test"})
+
+    # One response, and a single notification shared by both players
+    assert sorted(encoded) == ["notification", "response"]
+    assert next(c1.notifications) == next(c2.notifications)
@@ -3,6 +3,9 @@ import websockets
 import json
 from chimera.backend.websocket import WebSocketsChimeraServer
 from chimera.common import ErrorCode
+from chimera.common.codec import SUBPROTOCOL_CODECS
+from chimera.examples.p1wins import PlayerOneWins
+from tests.common.utils import create_request_msg, validate_notification
 
 
 @pytest.mark.asyncio
@@ -36,3 +39,87 @@ async def test_send_recv():
     assert msg["id"] is None
 
     await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_broadcast():
+    server = WebSocketsChimeraServer("127.0.0.1", "14200")
+    server.register_game("p1-wins", PlayerOneWins, "Player One Wins")
+    await server.start()
+
+    ws1 = await websockets.connect("ws://127.0.0.1:14200")
+    ws2 = await websockets.connect("ws://127.0.0.1:14200")
+
+    request = create_request_msg("create-match", 1, {"game": "p1-wins", "player-name": "Alex"})
+    await ws1.send(json.dumps(request))
+    msg = json.loads(await ws1.recv())
+    match_id = msg["result"]["match-id"]
+
+    request = create_request_msg("join-match", 1, {"game": "p1-wins", "match-id": match_id, "player-name": "Sam"})
+    await ws2.send(json.dumps(request))
+    msg = json.loads(await ws2.recv())
+    assert msg["result"] == {}
+
+    for ws in (ws1, ws2):
+        msg = json.loads(await ws.recv())
+        validate_notification(msg,
+                              expect_scope="match",
+                              expect_event="start",
+                              expect_match_id=match_id,
+                              expect_game_state={'player1_phrase': None, 'player2_phrase': None})
+
+    await ws1.close()
+    await ws2.close()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_pipelined_requests():
+    server = WebSocketsChimeraServer("127.0.0.1", "14200", max_concurrent_requests=4)
+    server.register_game("p1-wins", PlayerOneWins, "Player One Wins")
+    await server.start()
+
+    ws = await websockets.connect("ws://127.0.0.1:14200")
+
+    # Send all the requests before reading any of the responses
+    for msg_id in range(10):
+        request = create_request_msg("list-games", msg_id, {})
+        await ws.send(json.dumps(request))
+
+    responses = [json.loads(await ws.recv()) for _ in range(10)]
+
+    assert sorted(r["id"] for r in responses) == list(range(10))
+    for response in responses:
+        assert response["result"]["games"] == [{"id": "p1-wins", "description": "Player One Wins"}]
+
+    await ws.close()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif("chimera.msgpack" not in SUBPROTOCOL_CODECS, reason="msgpack is not installed")
+async def test_msgpack_subprotocol():
+    codec = SUBPROTOCOL_CODECS["chimera.msgpack"]
+
+    server = WebSocketsChimeraServer("127.0.0.1", "14200")
+    server.register_game("p1-wins", PlayerOneWins, "Player One Wins")
+    await server.start()
+
+    ws = await websockets.connect("ws://127.0.0.1:14200", subprotocols=["chimera.msgpack"])
+    assert ws.subprotocol == "chimera.msgpack"
+
+    await ws.send(codec.encode(create_request_msg("list-games", 1, {})))
+    msg = await ws.recv()
+
+    assert isinstance(msg, bytes)
+    msg = codec.decode(msg)
+    assert msg["id"] == 1
+    assert msg["result"]["games"] == [{"id": "p1-wins", "description": "Player One Wins"}]
+
+    # JSON is not accepted once MessagePack has been negotiated
+    await ws.send('{"foo": }')
+    msg = codec.decode(await ws.recv())
+    assert msg["error"]["code"] == ErrorCode.PARSE_ERROR.value
+
+    await ws.close()
+    await server.stop()
@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+
+from chimera.backend.websocket import WebSocketsChimeraServer
+from chimera.client import AsyncChimera
+from chimera.client.api import AsyncGame, AsyncMatch, MatchNotification
+from chimera.examples.chicken import Chicken
+from chimera.exceptions import ChimeraConnectionRefusedException, UnknownMatch
+
+
+@pytest.fixture
+async def server():
+    server = WebSocketsChimeraServer("127.0.0.1", "14200")
+    server.register_game("chicken", Chicken, "Chicken")
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_get_games(server):
+    async with AsyncChimera("127.0.0.1", "14200") as chimera:
+        games = await chimera.get_games()
+
+    assert set(games) == {"chicken"}
+    assert isinstance(games["chicken"], AsyncGame)
+    assert games["chicken"].description == "Chicken"
+
+
+@pytest.mark.asyncio
+async def test_connection_refused():
+    chimera = AsyncChimera("127.0.0.1", "14299")
+    with pytest.raises(ChimeraConnectionRefusedException):
+        await chimera.connect()
+
+
+@pytest.mark.asyncio
+async def test_join_unknown_match(server):
+    async with AsyncChimera("127.0.0.1", "14200") as chimera:
+        games = await chimera.get_games()
+        with pytest.raises(UnknownMatch):
+            await games["chicken"].join_match("foobar", "Alex")
+
+
+async def play_chicken(match, swerves):
+    notifications = []
+    async for notification in match.notifications():
+        notifications.append(notification.event)
+        if notification.event != MatchNotification.EVENT_END:
+            rounds = len(match.game_state["rounds"])
+            await match.game_action("move", {"swerve": rounds < swerves})
+    return notifications
+
+
+@pytest.mark.asyncio
+async def test_concurrent_matches(server):
+    num_matches = 50
+    num_rounds = 5
+
+    clients = [AsyncChimera("127.0.0.1", "14200") for _ in range(2 * num_matches)]
+    await asyncio.gather(*(client.connect() for client in clients))
+
+    matches = []
+    for c1, c2 in zip(clients[0::2], clients[1::2]):
+        chicken1 = (await c1.get_games())["chicken"]
+        chicken2 = (await c2.get_games())["chicken"]
+        m1 = await chicken1.create_match("Alex")
+        m2 = await chicken2.join_match(m1.id, "Sam")
+        assert isinstance(m1, AsyncMatch)
+        matches += [m1, m2]
+
+    results = await asyncio.gather(*(play_chicken(match, num_rounds) for match in matches))
+
+    for match, events in zip(matches, results):
+        assert events[0] == MatchNotification.EVENT_START
+        assert events[-1] == MatchNotification.EVENT_END
+        assert events.count(MatchNotification.EVENT_UPDATE) == num_rounds
+        assert match.status == AsyncMatch.STATUS_DONE
+        assert len(match.game_state["rounds"]) == num_rounds + 1
+
+    await asyncio.gather(*(client.disconnect() for client in clients))
+
+
+@pytest.mark.asyncio
+async def test_game_actions(server):
+    async with AsyncChimera("127.0.0.1", "14200") as c1, AsyncChimera("127.0.0.1", "14200") as c2:
+        m1 = await (await c1.get_games())["chicken"].create_match("Alex", delta_updates=True)
+        m2 = await (await c2.get_games())["chicken"].join_match(m1.id, "Sam")
+        await m1.wait_for_update()
+        await m2.wait_for_update()
+
+        results = await m1.game_actions([("move", {"swerve": True})] * 3)
+        assert len(results) == 3
+
+        await m2.game_action("move", {"swerve": True})
+        await m1.wait_for_update()
+        assert len(m1.game_state["rounds"]) == 1
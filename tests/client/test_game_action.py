@@ -3,7 +3,7 @@ import pytest
 from chimera.common import ErrorCode
 from chimera.exceptions import GameNoSuchAction, GameIncorrectActionData, GameNotPlayerTurn
 from tests.common.utils import validate_exc_info
-from tests.common.fixtures import test_client_p1wins
+from tests.common.fixtures import test_client_p1wins, test_client_chicken
 
 
 def test_game_action(test_client_p1wins):
@@ -48,3 +48,23 @@ def test_game_action_not_player_turn(test_client_p1wins):
         m2.game_action("move", {"phrase": "Test"})
 
     validate_exc_info(exc_info, ErrorCode.GAME_NOT_PLAYER_TURN)
+
+
+def test_game_actions(test_client_chicken):
+    c1, c2, m1, m2 = test_client_chicken
+
+    results = m1.game_actions([("move", {"swerve": True}), ("move", {"swerve": False})])
+
+    assert results == [{"swerve": True}, {"swerve": False}]
+
+
+def test_game_actions_error(test_client_p1wins):
+    c1, c2, m1, m2 = test_client_p1wins
+
+    with pytest.raises(GameNotPlayerTurn) as exc_info:
+        m1.game_actions([("move", {"phrase": "Test"}), ("move", {"phrase": "Test"})])
+
+    validate_exc_info(exc_info, ErrorCode.GAME_NOT_PLAYER_TURN)
+
+    # The first action was still performed
+    assert m2.game_action("move", {"phrase": "Test 2"}) == {"received": "Test 2"}
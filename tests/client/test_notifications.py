@@ -164,3 +164,49 @@ def test_notification_callback():
     assert m1.status == Match.STATUS_DONE
     assert m1.game_state == expect_game_state
     assert m1.winner == m1.player_name
+
+
+def test_notification_update_delta():
+    fs = FakeChimeraServer()
+    c1 = FakeChimera(fs)
+    c2 = FakeChimera(fs)
+
+    c1.add_game("chicken", Chicken, "Chicken")
+
+    m1 = c1.get_games()["chicken"].create_match("Alex", delta_updates=True)
+    m2 = c2.get_games()["chicken"].join_match(m1.id, "Sam", delta_updates=True)
+
+    m1.game_action("move", {"swerve": True})
+    m2.game_action("move", {"swerve": True})
+    m1.game_action("move", {"swerve": False})
+    m2.game_action("move", {"swerve": True})
+
+    c1.process_notifications()
+    c2.process_notifications()
+
+    expect_rounds = [{"p1_swerve": True, "p2_swerve": True, "p1_points": 1, "p2_points": 1},
+                     {"p1_swerve": False, "p2_swerve": True, "p1_points": 3, "p2_points": 0}]
+
+    for match in (m1, m2):
+        # Skip 'start' notification
+        match.next_notification().process()
+
+        notif = match.next_notification()
+        assert notif.event == MatchNotification.EVENT_UPDATE
+        assert notif.game_state == {"p1_points": 1, "p2_points": 1, "rounds": expect_rounds[:1]}
+        notif.process()
+
+        notif = match.next_notification()
+        assert notif.event == MatchNotification.EVENT_UPDATE
+        assert notif.game_state == {"p1_points": 4, "p2_points": 1, "rounds": expect_rounds}
+        notif.process()
+
+        assert match.game_state == {"p1_points": 4, "p2_points": 1, "rounds": expect_rounds}
+
+    m1.resync()
+    c1.process_notifications()
+
+    notif = m1.next_notification()
+    assert notif.event == MatchNotification.EVENT_UPDATE
+    assert "game-state-patch" not in notif._data
+    assert notif.game_state == {"p1_points": 4, "p2_points": 1, "rounds": expect_rounds}
@@ -1,14 +1,21 @@
 import asyncio
 import threading
+import time
 import pytest
 
 from chimera.backend.websocket import WebSocketsChimeraServer
 from chimera.client import Chimera
+from chimera.common.codec import SUBPROTOCOL_CODECS, get_codec
+from chimera.client.api import Match
+from chimera.examples.chicken import Chicken
+from chimera.examples.p1wins import PlayerOneWins
 
 
 async def server(stop_sig, server_ready, loop):
     asyncio.set_event_loop(loop)
     server = WebSocketsChimeraServer("127.0.0.1", "14200")
+    server.register_game("p1-wins", PlayerOneWins, "Player One Wins")
+    server.register_game("chicken", Chicken, "Chicken")
     await server.start()
     server_ready.set()
     await stop_sig
@@ -33,3 +40,60 @@ def threaded_server():
 def test_list_games(threaded_server):
     chimera = Chimera("127.0.0.1", "14200")
     games = chimera.get_games()
+
+
+@pytest.mark.skipif("chimera.msgpack" not in SUBPROTOCOL_CODECS, reason="msgpack is not installed")
+def test_list_games_msgpack(threaded_server):
+    chimera = Chimera("127.0.0.1", "14200", codec=get_codec("msgpack"))
+    assert chimera._connector._ws.codec.binary
+    games = chimera.get_games()
+    assert set(games) == {"p1-wins", "chicken"}
+
+
+def test_request_throughput(threaded_server):
+    chimera = Chimera("127.0.0.1", "14200")
+
+    num_requests = 2000
+    start = time.monotonic()
+    for _ in range(num_requests):
+        games = chimera.get_games()
+        assert "chicken" in games
+    elapsed = time.monotonic() - start
+
+    # The receive loop used to sleep for 10ms after every message,
+    # which capped clients at (at most) 100 requests per second
+    assert num_requests / elapsed > 500
+
+
+def test_notifications_delivered(threaded_server):
+    c1 = Chimera("127.0.0.1", "14200")
+    c2 = Chimera("127.0.0.1", "14200")
+
+    m1 = c1.get_games()["chicken"].create_match("Alex")
+    m2 = c2.get_games()["chicken"].join_match(m1.id, "Sam")
+
+    num_rounds = 200
+    for _ in range(num_rounds):
+        m1.game_action("move", {"swerve": True})
+        m2.game_action("move", {"swerve": True})
+    m1.game_action("move", {"swerve": False})
+    m2.game_action("move", {"swerve": False})
+
+    # Every player gets a start notification, one update per
+    # round (except the last one), and an end notification
+    for match in (m1, m2):
+        while match.status != Match.STATUS_DONE:
+            match.wait_for_update()
+        assert len(match.game_state["rounds"]) == num_rounds + 1
+        assert match.game_state["p1_points"] == num_rounds
+
+
+def test_send_requests(threaded_server):
+    chimera = Chimera("127.0.0.1", "14200")
+
+    responses = chimera.send_requests([("list-games", None)] * 10)
+
+    assert len(responses) == 10
+    assert len(set(r["id"] for r in responses)) == 10
+    for response in responses:
+        assert len(response["result"]["games"]) == 2
@@ -20,9 +20,11 @@ class TestChimeraServer(FakeChimeraServer):
         self.msg_id += 1
         return msg_id
 
-    async def create_match(self, client, match_game, player_name, validate_success=True):
+    async def create_match(self, client, match_game, player_name, validate_success=True, delta_updates=False):
         msg_id = self._get_msg_id()
         params = {"game": match_game, "player-name": player_name}
+        if delta_updates:
+            params["delta-updates"] = True
         request = create_request_msg("create-match", msg_id, params)
         request = json.dumps(request)
 
@@ -47,9 +49,11 @@ class TestChimeraServer(FakeChimeraServer):
 
         return response
 
-    async def join_match(self, client, match_game, match_id, player_name, validate_success=True):
+    async def join_match(self, client, match_game, match_id, player_name, validate_success=True, delta_updates=False):
         msg_id = self._get_msg_id()
         params = {"game": match_game, "match-id": match_id, "player-name": player_name}
+        if delta_updates:
+            params["delta-updates"] = True
         request = create_request_msg("join-match", msg_id, params)
         request = json.dumps(request)
 
@@ -72,16 +76,16 @@ class TestChimeraServer(FakeChimeraServer):
 
         return response
 
-    async def setup_match(self, games, match_game, p1_name, p2_name):
+    async def setup_match(self, games, match_game, p1_name, p2_name, delta_updates=(False, False)):
         player1 = self.create_client(p1_name)
         player2 = self.create_client(p2_name)
 
         for game_id, game_cls, description in games:
             self.register_game(game_id, game_cls, description)
 
-        response = await self.create_match(player1, match_game, p1_name)
+        response = await self.create_match(player1, match_game, p1_name, delta_updates=delta_updates[0])
         match_id = response["result"]["match-id"]
-        await self.join_match(player2, match_game, match_id, p2_name)
+        await self.join_match(player2, match_game, match_id, p2_name, delta_updates=delta_updates[1])
 
         match = self.matches[match_id]
         assert match.game.num_players == 2
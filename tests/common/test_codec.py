@@ -0,0 +1,45 @@
+import pytest
+
+from chimera.common.codec import CODECS, DEFAULT_CODEC, SUBPROTOCOL_CODECS, DecodeError, get_codec
+
+
+ALL_CODECS = list(CODECS.values()) + list(SUBPROTOCOL_CODECS.values())
+
+
+@pytest.fixture(params=ALL_CODECS, ids=lambda c: c.name)
+def codec(request):
+    return request.param
+
+
+def test_codec_roundtrip(codec):
+    msg = {"type": "notification",
+           "scope": "match",
+           "event": "update",
+           "data": {"match-id": "magnificent-platypus",
+                    "match-winner": None,
+                    "game-state": {"board": [[" ", "R"], ["Y", " "]],
+                                   "points": [1, 2.5],
+                                   "swerve": True,
+                                   "name": "Álex"}}}
+
+    raw_message = codec.encode(msg)
+
+    assert isinstance(raw_message, bytes if codec.binary else str)
+    assert codec.decode(raw_message) == msg
+
+
+@pytest.mark.parametrize("raw_message", ['{"foo": }', "", "[1, 2", b"\xff\xfe"])
+def test_codec_decode_error(codec, raw_message):
+    with pytest.raises(DecodeError):
+        codec.decode(raw_message)
+
+
+def test_get_codec():
+    assert get_codec() is DEFAULT_CODEC
+    assert get_codec("json") is CODECS["json"]
+
+    for codec in ALL_CODECS:
+        assert get_codec(codec.name) is codec
+
+    with pytest.raises(ValueError):
+        get_codec("foobar")
@@ -0,0 +1,61 @@
+import copy
+
+import pytest
+
+from chimera.common.jsonpatch import make_patch, apply_patch
+
+
+@pytest.mark.parametrize("old, new", [
+    ({"a": 1, "b": [1, 2]}, {"a": 1, "b": [1, 2]}),
+    ({"a": 1}, {"a": 2}),
+    ({"a": 1}, {"b": 1}),
+    ({"a": True}, {"a": 1}),
+    ({"a/b": 1, "c~d": 2}, {"a/b": 2, "c~d": 3}),
+    ({"rounds": []}, {"rounds": [{"x": 1}, {"x": 2}]}),
+    ({"rounds": [1, 2, 3]}, {"rounds": [1]}),
+    ([[" ", " "], [" ", " "]], [[" ", " "], ["R", " "]]),
+    ({"a": [1, 2]}, {"a": {"b": 1}}),
+    ({"a": None}, {"a": {"b": [None]}}),
+    (1, "foo"),
+])
+def test_patch_roundtrip(old, new):
+    old_copy = copy.deepcopy(old)
+
+    patch = make_patch(old, new)
+    patched = apply_patch(old, patch)
+
+    assert patched == new
+    assert old == old_copy
+
+
+def test_patch_only_changes():
+    board = [[" "] * 7 for _ in range(6)]
+    new_board = copy.deepcopy(board)
+    new_board[5][3] = "R"
+
+    patch = make_patch({"turn": "Alex", "board": board}, {"turn": "Sam", "board": new_board})
+
+    assert patch == [{"op": "replace", "path": "/turn", "value": "Sam"},
+                     {"op": "replace", "path": "/board/5/3", "value": "R"}]
+
+
+def test_patch_shares_unmodified_values():
+    old = {"a": [1, 2], "b": [3, 4]}
+
+    patched = apply_patch(old, [{"op": "replace", "path": "/a/0", "value": 5}])
+
+    assert patched == {"a": [5, 2], "b": [3, 4]}
+    assert patched["b"] is old["b"]
+    assert old == {"a": [1, 2], "b": [3, 4]}
+
+
+@pytest.mark.parametrize("patch", [
+    [{"op": "replace", "path": "/foo/bar", "value": 1}],
+    [{"op": "remove", "path": "/b/5"}],
+    [{"op": "move", "path": "/a"}],
+    [{"path": "/a"}],
+    [{"op": "add", "path": "a", "value": 1}],
+])
+def test_patch_incorrect(patch):
+    with pytest.raises(ValueError):
+        apply_patch({"a": 1, "b": [1]}, patch)
@@ -0,0 +1,138 @@
+import random
+
+import pytest
+
+from chimera.examples.connectm import ConnectMBoard, PieceColor
+
+
+class ReferenceConnectMBoard:
+    """
+    List-of-lists implementation of the Connect-M board (the one
+    ConnectMBoard used before switching to bitboards), used to check
+    that the bitboard implementation behaves exactly the same way.
+    """
+
+    def __init__(self, nrows, ncols, m):
+        self._board = [[None] * ncols for _ in range(nrows)]
+        self._top = [0] * ncols
+        self._nrows = nrows
+        self._ncols = ncols
+        self._m = m
+        self._winner = None
+
+    def can_drop(self, col):
+        return self._top[col] < self._nrows
+
+    def drop_wins(self, col, color):
+        if not self.can_drop(col):
+            return False
+
+        row = self._top[col]
+        self._set(row, col, color)
+        winner = self._winner_at(row, col)
+        self._set(row, col, None)
+
+        return winner
+
+    def drop(self, col, color):
+        row = self._top[col]
+        self._set(row, col, color)
+        self._top[col] += 1
+
+        if self._winner_at(row, col):
+            self._winner = color
+
+    def is_done(self):
+        return self._winner is not None or all(t == self._nrows for t in self._top)
+
+    def to_piece_grid(self):
+        return [list(row) for row in self._board]
+
+    def to_str_grid(self):
+        return [[" " if v is None else v.name[0] for v in row] for row in self._board]
+
+    def _get(self, row, col):
+        if not (0 <= row < self._nrows) or not (0 <= col < self._ncols):
+            return None
+        return self._board[(self._nrows - 1) - row][col]
+
+    def _set(self, row, col, color):
+        self._board[(self._nrows - 1) - row][col] = color
+
+    def _winner_at(self, row, col):
+        origin_piece = self._get(row, col)
+        for dr, dc in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+            total = 1
+            for sign in (+1, -1):
+                ir, ic = row, col
+                for _ in range(self._m - 1):
+                    ir, ic = ir + sign * dr, ic + sign * dc
+                    if self._get(ir, ic) != origin_piece:
+                        break
+                    total += 1
+            if total >= self._m:
+                return True
+
+        return False
+
+
+def check_same_board(board, ref):
+    assert board.to_str_grid() == ref.to_str_grid()
+    assert board.to_piece_grid() == ref.to_piece_grid()
+    assert board.is_done() == ref.is_done()
+    assert board.get_winner() == ref._winner
+
+    for col in range(ref._ncols):
+        assert board.can_drop(col) == ref.can_drop(col)
+        for color in PieceColor:
+            assert board.drop_wins(col, color) == ref.drop_wins(col, color)
+
+
+@pytest.mark.parametrize("nrows, ncols, m", [(6, 7, 4), (4, 4, 4), (5, 9, 3),
+                                             (9, 5, 5), (8, 8, 2), (12, 15, 6)])
+def test_connectm_board_differential(nrows, ncols, m):
+    rng = random.Random(f"{nrows}x{ncols}x{m}")
+
+    for _ in range(10):
+        board = ConnectMBoard(nrows, ncols, m)
+        ref = ReferenceConnectMBoard(nrows, ncols, m)
+        color = PieceColor.RED
+
+        # Keep dropping pieces (even after there is a winner)
+        # until the board is full
+        while not all(t == nrows for t in ref._top):
+            col = rng.choice([c for c in range(ncols) if ref.can_drop(c)])
+            board.drop(col, color)
+            ref.drop(col, color)
+
+            check_same_board(board, ref)
+
+            color = PieceColor.YELLOW if color == PieceColor.RED else PieceColor.RED
+
+
+def test_connectm_board_full_column():
+    board = ConnectMBoard(6, 7, 4)
+
+    for i in range(6):
+        board.drop(0, PieceColor.RED if i % 2 == 0 else PieceColor.YELLOW)
+
+    assert not board.can_drop(0)
+    assert not board.drop_wins(0, PieceColor.RED)
+    with pytest.raises(ValueError):
+        board.drop(0, PieceColor.RED)
+
+
+def test_connectm_board_reset():
+    board = ConnectMBoard(6, 7, 4)
+
+    for _ in range(4):
+        board.drop(3, PieceColor.RED)
+
+    assert board.get_winner() == PieceColor.RED
+    assert board.is_done()
+
+    board.reset()
+
+    assert board.get_winner() is None
+    assert not board.is_done()
+    assert board.to_str_grid() == [[" "] * 7 for _ in range(6)]